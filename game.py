@@ -1,6 +1,8 @@
 import pygame
 import os
 import sys
+from bisect import bisect_left
+from collections import defaultdict
 
 # Initialize Pygame
 pygame.init()
@@ -9,51 +11,55 @@ pygame.init()
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+GRID_CELL = 64  # spatial hash cell size in pixels
+
+# Player physics
+PLAYER_SPEED = 5
+GRAVITY = 0.5
+JUMP_VELOCITY = -15
 
 # Directories for assets
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 ASSET_DIR = BASE_DIR  # assets are stored in the repository root
 
-# Load images
-player_idle = pygame.image.load(os.path.join(ASSET_DIR, 'player_idle.png')).convert_alpha()
-player_run1 = pygame.image.load(os.path.join(ASSET_DIR, 'player_run1.png')).convert_alpha()
-player_run2 = pygame.image.load(os.path.join(ASSET_DIR, 'player_run2.png')).convert_alpha()
-platform_img = pygame.image.load(os.path.join(ASSET_DIR, 'platform.png')).convert_alpha()
-coin_img = pygame.image.load(os.path.join(ASSET_DIR, 'coin.png')).convert_alpha()
+
+def load_image(filename):
+    """Load an image from the asset directory, converted for fast blitting.
+
+    Must be called after ``pygame.display.set_mode``.
+    """
+    return pygame.image.load(os.path.join(ASSET_DIR, filename)).convert_alpha()
 
 class Player(pygame.sprite.Sprite):
     """Player sprite with simple animation and physics."""
-    def __init__(self):
+    __slots__ = ('images', 'index', 'image', 'rect', 'vel_y', 'on_ground', 'frame_timer')
+    def __init__(self, images):
         super().__init__()
-        self.images = [player_idle, player_run1, player_run2]
+        self.images = images
         self.index = 0
         self.image = self.images[self.index]
         self.rect = self.image.get_rect()
         self.rect.topleft = (100, SCREEN_HEIGHT - 150)
         self.vel_y = 0
-        self.speed = 5
         self.on_ground = False
         self.frame_timer = 0
 
-    def update(self, platforms):
+    def update(self, platform_grid):
         """Update player position and animation."""
         keys = pygame.key.get_pressed()
-        dx = 0
+        left, right, jump = keys[pygame.K_LEFT], keys[pygame.K_RIGHT], keys[pygame.K_SPACE]
         dy = 0
 
-        # Horizontal movement
-        if keys[pygame.K_LEFT]:
-            dx = -self.speed
-        if keys[pygame.K_RIGHT]:
-            dx = self.speed
+        # Horizontal movement (opposing keys cancel out)
+        dx = PLAYER_SPEED * (right - left)
 
         # Jumping
-        if keys[pygame.K_SPACE] and self.on_ground:
-            self.vel_y = -15
+        if jump and self.on_ground:
+            self.vel_y = JUMP_VELOCITY
             self.on_ground = False
 
         # Gravity
-        self.vel_y += 0.5
+        self.vel_y += GRAVITY
         dy += self.vel_y
 
         # Animation frames: run frames when moving; idle when stationary
@@ -72,25 +78,33 @@ class Player(pygame.sprite.Sprite):
 
         self.image = self.images[self.index]
 
+        # Sweep the player's rect over this frame's movement and gather the
+        # platforms it can touch once; both axis passes only test that subset
+        moved = self.rect.move(dx, 0)
+        moved.y += dy
+        swept = self.rect.union(moved)
+        nearby = nearby_rects(platform_grid, swept)
+        candidates = [nearby[i] for i in swept.collidelistall(nearby)]
+
         # Horizontal collision
         self.rect.x += dx
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
+        for plat in candidates:
+            if self.rect.colliderect(plat):
                 if dx > 0:
-                    self.rect.right = platform.rect.left
+                    self.rect.right = plat.left
                 elif dx < 0:
-                    self.rect.left = platform.rect.right
+                    self.rect.left = plat.right
 
         # Vertical movement and collision
         self.rect.y += dy
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
+        for plat in candidates:
+            if self.rect.colliderect(plat):
                 if self.vel_y > 0:
-                    self.rect.bottom = platform.rect.top
+                    self.rect.bottom = plat.top
                     self.vel_y = 0
                     self.on_ground = True
                 elif self.vel_y < 0:
-                    self.rect.top = platform.rect.bottom
+                    self.rect.top = plat.bottom
                     self.vel_y = 0
 
         # Reset if player falls below screen
@@ -104,84 +118,147 @@ class Player(pygame.sprite.Sprite):
 
 class Platform(pygame.sprite.Sprite):
     """Static platform using the platform image."""
-    def __init__(self, x, y):
+    __slots__ = ('image', 'rect')
+    def __init__(self, image, x, y):
         super().__init__()
-        self.image = platform_img
+        self.image = image
         self.rect = self.image.get_rect(topleft=(x, y))
 
 class Coin(pygame.sprite.Sprite):
     """Collectible coin sprite."""
-    def __init__(self, x, y):
+    __slots__ = ('image', 'rect')
+    def __init__(self, image, x, y):
         super().__init__()
-        self.image = coin_img
+        self.image = image
         self.rect = self.image.get_rect(center=(x, y))
 
 
+class CoinSweep:
+    """Coins sorted by left edge so only those near the player's x-range are tested."""
+    def __init__(self, coins):
+        self.coins = sorted(coins, key=lambda coin: coin.rect.left)
+        self.lefts = [coin.rect.left for coin in self.coins]
+        self.max_width = max((coin.rect.width for coin in self.coins), default=0)
+
+    def collect(self, rect):
+        """Remove and return the coins overlapping ``rect``."""
+        lo = bisect_left(self.lefts, rect.left - self.max_width)
+        hi = bisect_left(self.lefts, rect.right, lo)
+        hits = []
+        for i in range(hi - 1, lo - 1, -1):
+            if rect.colliderect(self.coins[i].rect):
+                hits.append(self.coins.pop(i))
+                del self.lefts[i]
+        return hits
+
+
+def build_platform_grid(platforms):
+    """Bucket platform rects into a spatial hash keyed by (cell_x, cell_y)."""
+    grid = defaultdict(list)
+    for platform in platforms:
+        rect = platform.rect
+        for cx in range(rect.left // GRID_CELL, (rect.right - 1) // GRID_CELL + 1):
+            for cy in range(rect.top // GRID_CELL, (rect.bottom - 1) // GRID_CELL + 1):
+                grid[(cx, cy)].append(rect)
+    return grid
+
+
+def nearby_rects(grid, rect):
+    """Return the platform rects sharing a grid cell with ``rect``, without duplicates."""
+    found = {}
+    for cx in range(rect.left // GRID_CELL, (rect.right - 1) // GRID_CELL + 1):
+        for cy in range(rect.top // GRID_CELL, (rect.bottom - 1) // GRID_CELL + 1):
+            for plat in grid.get((cx, cy), ()):
+                found[id(plat)] = plat
+    return list(found.values())
+
+
 def main():
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("2D Platformer Game")
     clock = pygame.time.Clock()
 
+    # Load images now that the display format is known
+    player_images = [load_image('player_idle.png'), load_image('player_run1.png'),
+                     load_image('player_run2.png')]
+    platform_img = load_image('platform.png')
+    coin_img = load_image('coin.png')
+
     # Groups and sprites
-    player = Player()
-    platforms = pygame.sprite.Group()
-    coins = pygame.sprite.Group()
+    player = Player(player_images)
+    platforms = []
+    player_group = pygame.sprite.RenderUpdates(player)
+    coins = pygame.sprite.RenderUpdates()
 
     # Ground platform (full width)
-    platforms.add(Platform(0, SCREEN_HEIGHT - platform_img.get_height()))
+    platforms.append(Platform(platform_img, 0, SCREEN_HEIGHT - platform_img.get_height()))
 
     # Additional platforms for jumping
-    platforms.add(Platform(200, 450))
-    platforms.add(Platform(400, 350))
-    platforms.add(Platform(600, 250))
-
-    # Add some coins on platforms
-    coins.add(Coin(220, 420))
-    coins.add(Coin(420, 320))
-    coins.add(Coin(620, 220))
+    platforms.append(Platform(platform_img, 200, 450))
+    platforms.append(Platform(platform_img, 400, 350))
+    platforms.append(Platform(platform_img, 600, 250))
+    platform_grid = build_platform_grid(platforms)
+
+    # Add some coins on platforms. They never move, so the same sprites are
+    # re-added when the coins are reset.
+    coin_pool = [Coin(coin_img, 220, 420), Coin(coin_img, 420, 320), Coin(coin_img, 620, 220)]
+    coins.add(coin_pool)
+    coin_sweep = CoinSweep(coins)
+
+    # Static background (light sky blue) with the platforms drawn in once; it is
+    # also the source used to erase moving sprites between frames
+    background = pygame.Surface(screen.get_size()).convert()
+    background.fill((135, 206, 235))
+    background.blits([(platform.image, platform.rect) for platform in platforms], doreturn=False)
+    screen.blit(background, (0, 0))
+    pygame.display.flip()
 
     font = pygame.font.SysFont(None, 36)
     score = 0
+    hud_rect = pygame.Rect(10, 10, 0, 0)
+    # Score text is only re-rendered when the score changes
+    score_text = None
+    rendered_score = None
 
     running = True
     while running:
-        clock.tick(FPS)
+        # Busy-wait for precise frame pacing; returns at once if the frame overran
+        clock.tick_busy_loop(FPS)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
 
         # Update player and check if they fall off screen
-        alive = player.update(platforms)
+        alive = player.update(platform_grid)
 
         # Check for coin collisions and update score
-        collected = pygame.sprite.spritecollide(player, coins, True)
+        collected = coin_sweep.collect(player.rect)
+        for coin in collected:
+            coin.kill()
         score += len(collected)
 
-        # Draw background (light sky blue)
-        screen.fill((135, 206, 235))
-
-        # Draw platforms
-        for platform in platforms:
-            screen.blit(platform.image, platform.rect)
-
-        # Draw coins
-        for coin in coins:
-            screen.blit(coin.image, coin.rect)
-
-        # Draw player
-        screen.blit(player.image, player.rect)
+        # Erase coins, player and score text where they were last drawn
+        coins.clear(screen, background)
+        player_group.clear(screen, background)
+        screen.blit(background, hud_rect, hud_rect)
 
-        # Draw score text
-        score_text = font.render(f"Score: {score}", True, (0, 0, 0))
-        screen.blit(score_text, (10, 10))
+        # Redraw them and push only the changed regions to the display
+        dirty = coins.draw(screen) + player_group.draw(screen)
+        dirty.append(hud_rect)
+        if score != rendered_score:
+            score_text = font.render(f"Score: {score}", True, (0, 0, 0))
+            rendered_score = score
+        hud_rect = screen.blit(score_text, (10, 10))
+        dirty.append(hud_rect)
 
-        pygame.display.flip()
+        pygame.display.update(dirty)
 
         # If player fell, reset coins and score
         if not alive:
             # Reset coins
             coins.empty()
-            coins.add(Coin(220, 420), Coin(420, 320), Coin(620, 220))
+            coins.add(coin_pool)
+            coin_sweep = CoinSweep(coins)
             score = 0
 
     pygame.quit()
@@ -9,7 +9,8 @@ directory, draws a scrolling‐style level on a single screen, and cycles
 through a list of predefined level layouts once all coins are collected.
 
 Instructions:
-  • Install Pygame if you haven't already: ``pip install pygame``.
+  • Install Pygame if you haven't already: ``pip install pygame`` (or
+    ``pip install pygame-ce``).
   • Run this script with ``python game_enhanced.py``.
   • Use the left/right arrow keys to move and spacebar to jump.
   • Collect all the coins to advance to the next level. When all levels
@@ -18,22 +19,38 @@ Instructions:
 
 import os
 import sys
+from bisect import bisect_left
+from collections import defaultdict
+
 import pygame
 
+# Cell size, in pixels, of the spatial hash used for platform collision queries
+GRID_CELL_SIZE = 64
+
+# Player physics: horizontal speed, per-frame gravity and jump impulse
+PLAYER_SPEED = 5
+GRAVITY = 0.5
+JUMP_VELOCITY = -15
+
 
-def load_image(asset_dir: str, filename: str) -> pygame.Surface:
-    """Load an image from disk.
+def load_image(asset_dir: str, filename: str, alpha: bool = True) -> pygame.Surface:
+    """Load an image from disk and convert it to the display's pixel format.
+
+    Must be called after ``pygame.display.set_mode``.
 
     Args:
         asset_dir: Directory where assets are stored.
         filename: Name of the image file to load.
+        alpha: Keep per-pixel alpha. Pass ``False`` for opaque art such as
+            backgrounds, which then takes the faster no-alpha blit path.
 
     Returns:
         A pygame.Surface containing the loaded image.
     """
     path = os.path.join(asset_dir, filename)
     try:
-        return pygame.image.load(path)
+        image = pygame.image.load(path)
+        return image.convert_alpha() if alpha else image.convert()
     except pygame.error as exc:
         raise SystemExit(f"Unable to load image {filename}: {exc}")
 
@@ -41,6 +58,8 @@ def load_image(asset_dir: str, filename: str) -> pygame.Surface:
 class Player(pygame.sprite.Sprite):
     """Player sprite implementing simple physics and animation."""
 
+    __slots__ = ('images', 'index', 'image', 'rect', 'vel_y', 'on_ground', 'frame_timer')
+
     def __init__(self, images: list[pygame.Surface], start_pos: tuple[int, int]) -> None:
         super().__init__()
         self.images = images
@@ -49,52 +68,56 @@ class Player(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
         self.rect.topleft = start_pos
         self.vel_y = 0.0
-        self.speed = 5
         self.on_ground = False
         self.frame_timer = 0
 
-    def update(self, platforms: pygame.sprite.Group) -> None:
+    def update(self, platform_grid: dict[tuple[int, int], list[pygame.Rect]]) -> None:
         """Update the player's position, handle animation and collisions."""
         keys = pygame.key.get_pressed()
-        dx = 0
+        left, right, jump = keys[pygame.K_LEFT], keys[pygame.K_RIGHT], keys[pygame.K_SPACE]
         dy = 0
 
-        # Horizontal movement
-        if keys[pygame.K_LEFT]:
-            dx = -self.speed
-        if keys[pygame.K_RIGHT]:
-            dx = self.speed
+        # Horizontal movement (opposing keys cancel out)
+        dx = PLAYER_SPEED * (right - left)
 
         # Jumping
-        if keys[pygame.K_SPACE] and self.on_ground:
-            self.vel_y = -15
+        if jump and self.on_ground:
+            self.vel_y = JUMP_VELOCITY
             self.on_ground = False
 
         # Apply gravity
-        self.vel_y += 0.5
+        self.vel_y += GRAVITY
         dy += self.vel_y
 
         # Collision detection with platforms
         self.on_ground = False
+        # Sweep the player's rect over this frame's movement and gather the
+        # platforms it can touch once; both axis passes only test that subset
+        moved = self.rect.move(dx, 0)
+        moved.y += dy
+        swept = self.rect.union(moved)
+        nearby = nearby_rects(platform_grid, swept)
+        candidates = [nearby[i] for i in swept.collidelistall(nearby)]
+
         # horizontal movement
         self.rect.x += dx
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
+        for plat in candidates:
+            if self.rect.colliderect(plat):
                 if dx > 0:
-                    self.rect.right = platform.rect.left
+                    self.rect.right = plat.left
                 elif dx < 0:
-                    self.rect.left = platform.rect.right
+                    self.rect.left = plat.right
 
         # vertical movement
         self.rect.y += dy
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
+        for plat in candidates:
+            if self.rect.colliderect(plat):
                 if dy > 0:
-                    self.rect.bottom = platform.rect.top
+                    self.rect.bottom = plat.top
                     self.vel_y = 0
                     self.on_ground = True
                 elif dy < 0:
-                    self.rect.top = platform.rect.bottom
+                    self.rect.top = plat.bottom
                     self.vel_y = 0
 
         # Animation frames: run frames when moving; idle frame when stationary
@@ -113,6 +136,8 @@ class Player(pygame.sprite.Sprite):
 class Platform(pygame.sprite.Sprite):
     """Platform sprite representing a solid surface."""
 
+    __slots__ = ('image', 'rect')
+
     def __init__(self, image: pygame.Surface, pos: tuple[int, int]) -> None:
         super().__init__()
         self.image = image
@@ -122,46 +147,120 @@ class Platform(pygame.sprite.Sprite):
 class Coin(pygame.sprite.Sprite):
     """Coin sprite which can be collected by the player."""
 
+    __slots__ = ('image', 'rect')
+
     def __init__(self, image: pygame.Surface, pos: tuple[int, int]) -> None:
         super().__init__()
         self.image = image
         self.rect = self.image.get_rect(center=pos)
 
 
+class CoinSweep:
+    """One-dimensional sweep-and-prune index over a level's coins.
+
+    Coins are kept sorted by their left edge, so a query only runs the full
+    rectangle test on coins whose x-range can reach the query rectangle.
+    """
+
+    def __init__(self, coins: pygame.sprite.Group) -> None:
+        self.coins = sorted(coins, key=lambda coin: coin.rect.left)
+        self.lefts = [coin.rect.left for coin in self.coins]
+        self.max_width = max((coin.rect.width for coin in self.coins), default=0)
+
+    def collect(self, rect: pygame.Rect) -> list[Coin]:
+        """Remove and return the coins overlapping ``rect``."""
+        lo = bisect_left(self.lefts, rect.left - self.max_width)
+        hi = bisect_left(self.lefts, rect.right, lo)
+        hits = []
+        for i in range(hi - 1, lo - 1, -1):
+            if rect.colliderect(self.coins[i].rect):
+                hits.append(self.coins.pop(i))
+                del self.lefts[i]
+        return hits
+
+
+def build_platform_grid(platforms: list[Platform]) -> dict[tuple[int, int], list[pygame.Rect]]:
+    """Bucket platform rects into a uniform spatial hash.
+
+    Args:
+        platforms: Platforms for the current level.
+
+    Returns:
+        A mapping from ``(cell_x, cell_y)`` to the platform rects overlapping that cell.
+    """
+    grid: dict[tuple[int, int], list[pygame.Rect]] = defaultdict(list)
+    for platform in platforms:
+        rect = platform.rect
+        for cx in range(rect.left // GRID_CELL_SIZE, (rect.right - 1) // GRID_CELL_SIZE + 1):
+            for cy in range(rect.top // GRID_CELL_SIZE, (rect.bottom - 1) // GRID_CELL_SIZE + 1):
+                grid[(cx, cy)].append(rect)
+    return grid
+
+
+def nearby_rects(grid: dict[tuple[int, int], list[pygame.Rect]],
+                 rect: pygame.Rect) -> list[pygame.Rect]:
+    """Collect the platform rects sharing at least one grid cell with ``rect``.
+
+    Args:
+        grid: Spatial hash built by :func:`build_platform_grid`.
+        rect: Rectangle to query.
+
+    Returns:
+        The candidate rects, deduplicated and in insertion order, ready to be
+        passed to :meth:`pygame.Rect.collidelistall`.
+    """
+    found: dict[int, pygame.Rect] = {}
+    for cx in range(rect.left // GRID_CELL_SIZE, (rect.right - 1) // GRID_CELL_SIZE + 1):
+        for cy in range(rect.top // GRID_CELL_SIZE, (rect.bottom - 1) // GRID_CELL_SIZE + 1):
+            for plat in grid.get((cx, cy), ()):
+                found[id(plat)] = plat
+    return list(found.values())
+
+
 def load_level(level_index: int,
                levels: list[dict[str, list[tuple[int, int]]]],
-               platform_img: pygame.Surface,
-               coin_img: pygame.Surface,
+               platform_pool: list[Platform],
+               coin_pool: list[Coin],
                all_sprites: pygame.sprite.Group,
-               platforms: pygame.sprite.Group,
-               coins: pygame.sprite.Group) -> None:
+               platforms: list[Platform],
+               coins: pygame.sprite.Group) -> list[tuple[pygame.Surface, pygame.Rect]]:
     """Load a level from the levels data into sprite groups.
 
+    Sprites are taken from pre-allocated pools and repositioned rather than
+    created afresh, so reloading a level does not allocate new objects.
+
     Args:
         level_index: Index of the level to load.
         levels: List of level definitions.
-        platform_img: Image for platforms.
-        coin_img: Image for coins.
+        platform_pool: Reusable platforms, at least as many as any level needs.
+        coin_pool: Reusable coins, at least as many as any level needs.
         all_sprites: Group to which all sprites are added.
-        platforms: Group to which platforms are added.
+        platforms: List to which platforms are added. A plain list is used
+            since platforms are static for the lifetime of a level.
         coins: Group to which coins are added.
+
+    Returns:
+        The ``(image, rect)`` blit sequence for the level's platforms. Platforms
+        never move within a level, so the sequence can be reused every frame.
     """
     # Clear existing platforms and coins
-    platforms.empty()
+    platforms.clear()
     coins.empty()
 
     level = levels[level_index]
-    # Create platforms
-    for pos in level['platforms']:
-        plat = Platform(platform_img, pos)
-        platforms.add(plat)
+    # Place platforms
+    for plat, pos in zip(platform_pool, level['platforms']):
+        plat.rect.topleft = pos
+        platforms.append(plat)
         all_sprites.add(plat)
-    # Create coins
-    for pos in level['coins']:
-        coin = Coin(coin_img, pos)
+    # Place coins
+    for coin, pos in zip(coin_pool, level['coins']):
+        coin.rect.center = pos
         coins.add(coin)
         all_sprites.add(coin)
 
+    return [(plat.image, plat.rect) for plat in platforms]
+
 
 def main() -> None:
     """Entry point for the enhanced 2D platformer game."""
@@ -181,11 +280,11 @@ def main() -> None:
     ASSET_DIR = BASE_DIR  # assets are stored in the repository root
 
     # Load images
-    background_img = load_image(ASSET_DIR, 'background_v2.png')
+    background_img = load_image(ASSET_DIR, 'background_v2.png', alpha=False)
     player_idle = load_image(ASSET_DIR, 'player_idle_v2.png')
     player_run1 = load_image(ASSET_DIR, 'player_run1_v2.png')
     player_run2 = load_image(ASSET_DIR, 'player_run2_v2.png')
-    platform_img = load_image(ASSET_DIR, 'platform_v2.png')
+    platform_img = load_image(ASSET_DIR, 'platform_v2.png', alpha=False)
     coin_img = load_image(ASSET_DIR, 'coin_v2.png')
 
     # Scale platform and background to appropriate sizes if necessary
@@ -198,8 +297,9 @@ def main() -> None:
 
     # Sprite groups
     all_sprites = pygame.sprite.Group()
-    platforms = pygame.sprite.Group()
-    coins = pygame.sprite.Group()
+    platforms: list[Platform] = []
+    coins = pygame.sprite.RenderUpdates()
+    player_group = pygame.sprite.RenderUpdates(player)
 
     all_sprites.add(player)
 
@@ -229,22 +329,46 @@ def main() -> None:
     score = 0
     font = pygame.font.SysFont(None, 36)
 
+    # Sprite pools sized for the largest level, reused by every level load
+    platform_pool = [Platform(platform_img, (0, 0))
+                     for _ in range(max(len(level['platforms']) for level in levels))]
+    coin_pool = [Coin(coin_img, (0, 0)) for _ in range(max(len(level['coins']) for level in levels))]
+
+    # Backgrounds with each level's static platforms composited in, baked on first use
+    level_backgrounds: dict[int, pygame.Surface] = {}
+
+    def start_level(index: int) -> tuple[dict[tuple[int, int], list[pygame.Rect]], CoinSweep, pygame.Surface]:
+        platform_blits = load_level(index, levels, platform_pool, coin_pool, all_sprites, platforms, coins)
+        if index not in level_backgrounds:
+            baked = background_img.copy()
+            baked.blits(platform_blits, doreturn=False)
+            level_backgrounds[index] = baked
+        return build_platform_grid(platforms), CoinSweep(coins), level_backgrounds[index]
+
     # Load the first level
-    load_level(level_index, levels, platform_img, coin_img, all_sprites, platforms, coins)
+    platform_grid, coin_sweep, level_bg = start_level(level_index)
+    full_redraw = True
+    hud_rect = pygame.Rect(10, 10, 0, 0)
+    # HUD text is only re-rendered when the level or score changes
+    score_text = None
+    rendered_hud = None
 
     running = True
     while running:
-        clock.tick(FPS)
+        # Busy-wait for precise frame pacing; returns at once if the frame overran
+        clock.tick_busy_loop(FPS)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
 
         # Update player
-        player.update(platforms)
+        player.update(platform_grid)
 
         # Check coin collisions
-        coin_hits = pygame.sprite.spritecollide(player, coins, dokill=True)
+        coin_hits = coin_sweep.collect(player.rect)
         if coin_hits:
+            for coin in coin_hits:
+                coin.kill()
             score += len(coin_hits)
 
         # If all coins are collected, advance to next level or finish
@@ -255,7 +379,8 @@ def main() -> None:
                 running = False
             else:
                 # Load next level
-                load_level(level_index, levels, platform_img, coin_img, all_sprites, platforms, coins)
+                platform_grid, coin_sweep, level_bg = start_level(level_index)
+                full_redraw = True
                 # Reset player position
                 player.rect.topleft = (50, SCREEN_HEIGHT - 150)
                 player.vel_y = 0
@@ -264,23 +389,37 @@ def main() -> None:
         # Reset if player falls off screen
         if player.rect.top > SCREEN_HEIGHT:
             # Reset level and player
-            load_level(level_index, levels, platform_img, coin_img, all_sprites, platforms, coins)
+            platform_grid, coin_sweep, level_bg = start_level(level_index)
+            full_redraw = True
             player.rect.topleft = (50, SCREEN_HEIGHT - 150)
             player.vel_y = 0
             player.on_ground = False
             score = 0
 
-        # Draw everything
-        screen.blit(background_img, (0, 0))
-        platforms.draw(screen)
-        coins.draw(screen)
-        screen.blit(player.image, player.rect)
+        # Draw everything. The baked level background replaces separate background
+        # and platform draws. After a level (re)load the whole screen is repainted;
+        # otherwise only the areas covered by coins, player and HUD are refreshed.
+        if full_redraw:
+            screen.blit(level_bg, (0, 0))
+        else:
+            coins.clear(screen, level_bg)
+            player_group.clear(screen, level_bg)
+            screen.blit(level_bg, hud_rect, hud_rect)
+        dirty = coins.draw(screen) + player_group.draw(screen)
+        dirty.append(hud_rect)
 
         # Draw score and level text
-        score_text = font.render(f"Level {level_index + 1}    Score: {score}", True, (0, 0, 0))
-        screen.blit(score_text, (10, 10))
-
-        pygame.display.flip()
+        if (level_index, score) != rendered_hud:
+            score_text = font.render(f"Level {level_index + 1}    Score: {score}", True, (0, 0, 0))
+            rendered_hud = (level_index, score)
+        hud_rect = screen.blit(score_text, (10, 10))
+        dirty.append(hud_rect)
+
+        if full_redraw:
+            pygame.display.flip()
+            full_redraw = False
+        else:
+            pygame.display.update(dirty)
 
     # Display completion message
     screen.fill((0, 0, 0))
@@ -44,10 +44,11 @@ before running. Run the script from the repository root:
 
 """
 
+import functools
 import os
 import random
 import sys
-from typing import List
+from typing import Dict, List, Tuple
 
 import pygame
 
@@ -57,12 +58,18 @@ import pygame
 # ---------------------------------------------------------------------------
 SCREEN_WIDTH, SCREEN_HEIGHT = 1000, 600
 FPS = 60
+DT = 1 / 60.0  # fixed simulation step in seconds
+MAX_FRAME_TIME = 0.25  # clamp long frames so the simulation cannot spiral
+TICK_SLACK = 0.001  # clock.tick() reports whole milliseconds
+WAIT_EVENTS = (pygame.QUIT, pygame.KEYDOWN)  # events the game over / win screens react to
 GRAVITY = 0.8
 PLAYER_SPEED = 5
 PLAYER_JUMP_VELOCITY = -16
 ATTACK_DURATION = 15  # frames that attack animation is active
 ENEMY_SPEED = 2
+ENEMY_ACTIVE_MARGIN = 200  # enemies further than this outside the view are not updated
 LEVEL_COUNT = 30
+GRID_CELL = 64  # spatial hash cell size in pixels; matches the platform tile width
 
 # Asset directory relative to this script. All art assets (player frames,
 # enemy, platform, background, coin frames, heart) are expected to live
@@ -77,11 +84,18 @@ ASSET_DIR = os.path.dirname(__file__)
 # ---------------------------------------------------------------------------
 # Utility functions
 # ---------------------------------------------------------------------------
-def load_image(name: str) -> pygame.Surface:
-    """Load an image from the asset directory and convert for blitting."""
+@functools.lru_cache(maxsize=None)
+def load_image(name: str, alpha: bool = True) -> pygame.Surface:
+    """Load an image from the asset directory and convert for blitting.
+
+    Results are cached, so repeated loads of the same asset share one
+    Surface; callers must not draw onto the returned image. Opaque art
+    should pass ``alpha=False`` to take the faster non-alpha blit path.
+    Requires the display mode to have been set.
+    """
     path = os.path.join(ASSET_DIR, name)
-    image = pygame.image.load(path).convert_alpha()
-    return image
+    image = pygame.image.load(path)
+    return image.convert_alpha() if alpha else image.convert()
 
 
 def flip_images(images: List[pygame.Surface]) -> List[pygame.Surface]:
@@ -89,6 +103,26 @@ def flip_images(images: List[pygame.Surface]) -> List[pygame.Surface]:
     return [pygame.transform.flip(img, True, False) for img in images]
 
 
+def grid_cells(rect: pygame.Rect):
+    """Yield the ``(cell_x, cell_y)`` keys of every grid cell ``rect`` overlaps."""
+    for cx in range(rect.left // GRID_CELL, (rect.right - 1) // GRID_CELL + 1):
+        for cy in range(rect.top // GRID_CELL, (rect.bottom - 1) // GRID_CELL + 1):
+            yield cx, cy
+
+
+def query_grid(grid: Dict[Tuple[int, int], List[pygame.Rect]],
+               rect: pygame.Rect) -> List[pygame.Rect]:
+    """Return the platform rects stored in the cells overlapped by ``rect``.
+
+    A platform spanning several cells is only returned once.
+    """
+    found = {}
+    for cell in grid_cells(rect):
+        for plat in grid.get(cell, ()):
+            found[id(plat)] = plat
+    return list(found.values())
+
+
 # ---------------------------------------------------------------------------
 # Sprite classes
 # ---------------------------------------------------------------------------
@@ -102,52 +136,47 @@ class Platform(pygame.sprite.Sprite):
 
 
 class Coin(pygame.sprite.Sprite):
-    """Animated coin that can be collected by the player."""
+    """Animated coin that can be collected by the player.
+
+    All coins spin in lockstep, so the animation frame is tracked once by
+    :class:`Game` and drawn for every coin rather than stored per sprite.
+    """
 
-    def __init__(self, x: int, y: int, frames: List[pygame.Surface]):
+    def __init__(self, x: int, y: int, image: pygame.Surface):
         super().__init__()
-        self.frames = frames
-        self.frame_index = 0
-        self.image = self.frames[self.frame_index]
+        self.image = image
         self.rect = self.image.get_rect(midbottom=(x, y))
-        self.animation_counter = 0
-
-    def update(self, *args):  # noqa: D401
-        """Advance the coin animation."""
-        self.animation_counter += 1
-        if self.animation_counter % 10 == 0:
-            self.frame_index = (self.frame_index + 1) % len(self.frames)
-            self.image = self.frames[self.frame_index]
 
 
 class Enemy(pygame.sprite.Sprite):
     """Enemy that patrols back and forth across platforms."""
 
-    def __init__(self, x: int, y: int, platforms: pygame.sprite.Group,
-                 image: pygame.Surface):
+    def __init__(self, x: int, y: int, platform_grid: Dict[Tuple[int, int], List[pygame.Rect]],
+                 image_right: pygame.Surface, image_left: pygame.Surface,
+                 rng: random.Random = random):
         super().__init__()
-        self.image_right = image
-        self.image_left = pygame.transform.flip(image, True, False)
-        self.image = self.image_right
+        # Both orientations are shared by every enemy; see Game.__init__
+        # Indexed by (direction + 1) >> 1: 0 faces left, 1 faces right
+        self.images = (image_left, image_right)
+        self.image = image_right
         self.rect = self.image.get_rect(midbottom=(x, y))
-        self.direction = random.choice([-1, 1])  # -1 = left, 1 = right
-        self.platforms = platforms
+        self.direction = rng.choice([-1, 1])  # -1 = left, 1 = right
+        self.platform_grid = platform_grid
         self.speed = ENEMY_SPEED
+        # Probe rect used for the ground check, moved in place every update
+        self._below_rect = self.rect.copy()
 
-    def update(self, camera_dx: int):  # noqa: D401
+    def update(self):  # noqa: D401
         """Move the enemy and flip direction when reaching platform edges."""
         # apply horizontal movement
         self.rect.x += self.direction * self.speed
 
         # Determine if the enemy is still on a platform
-        # We shift the rect down slightly to check if there is ground beneath
-        below = self.rect.copy()
-        below.y += 5
-        on_platform = False
-        for platform in self.platforms:
-            if below.colliderect(platform.rect):
-                on_platform = True
-                break
+        # We shift the rect down slightly to check if there is ground beneath,
+        # testing only the platforms sharing a grid cell with the probe
+        below = self._below_rect
+        below.update(self.rect.x, self.rect.y + 5, self.rect.w, self.rect.h)
+        on_platform = below.collidelist(query_grid(self.platform_grid, below)) != -1
 
         # If no platform below or at edge of platform, flip direction
         if not on_platform:
@@ -155,29 +184,23 @@ class Enemy(pygame.sprite.Sprite):
             self.rect.x += self.direction * self.speed * 2  # step away from edge
 
         # Choose appropriate sprite orientation
-        if self.direction < 0:
-            self.image = self.image_left
-        else:
-            self.image = self.image_right
-        
-        # Apply camera shift
-        self.rect.x -= camera_dx
+        self.image = self.images[(self.direction + 1) >> 1]
 
 
 class Player(pygame.sprite.Sprite):
     """Player character with movement, jump, attack and animation logic."""
 
-    def __init__(self, x: int, y: int, platforms: pygame.sprite.Group,
-                 coins: pygame.sprite.Group, enemies: pygame.sprite.Group,
+    def __init__(self, x: int, y: int, platform_grid: Dict[Tuple[int, int], List[pygame.Rect]],
+                 ground_rect: pygame.Rect, coins: pygame.sprite.Group, enemies: pygame.sprite.Group,
                  images_right: List[pygame.Surface], images_left: List[pygame.Surface]):
         super().__init__()
         # animation frames for different states
-        self.images_right = images_right
-        self.images_left = images_left
+        # Indexed by direction > 0: False faces left, True faces right
+        self.images_by_dir = (images_left, images_right)
         # indices: 0 = idle, 1-3 = run, 4 = jump, 5 = attack
         self.frame_index = 0
         self.direction = 1  # 1 = right, -1 = left
-        self.image = self.images_right[self.frame_index]
+        self.image = images_right[self.frame_index]
         self.rect = self.image.get_rect(midbottom=(x, y))
         
         # movement attributes
@@ -185,7 +208,8 @@ class Player(pygame.sprite.Sprite):
         self.vel_y = 0
         self.on_ground = False
         
-        self.platforms = platforms
+        self.platform_grid = platform_grid
+        self.ground_rect = ground_rect
         self.coins = coins
         self.enemies = enemies
 
@@ -217,8 +241,11 @@ class Player(pygame.sprite.Sprite):
                 self.attacking = True
                 self.attack_timer = ATTACK_DURATION
 
-    def update(self):  # noqa: D401
-        """Update position, handle collisions, animate and resolve interactions."""
+    def update(self, ticks: int):  # noqa: D401
+        """Update position, handle collisions, animate and resolve interactions.
+
+        ``ticks`` is the frame's timestamp from ``pygame.time.get_ticks``.
+        """
         # Apply gravity
         self.vel_y += GRAVITY
         
@@ -258,16 +285,32 @@ class Player(pygame.sprite.Sprite):
                 self.attacking = False
 
         # Animation logic
-        self.animate()
+        self.animate(ticks)
+
+    def nearby_platforms(self, rect: pygame.Rect) -> List[pygame.Rect]:
+        """Return candidate platform rects near ``rect``, including the ground strip."""
+        candidates = query_grid(self.platform_grid, rect)
+        candidates.append(self.ground_rect)
+        return candidates
+
+    def overlapping_platforms(self) -> List[pygame.Rect]:
+        """Return the nearby platform rects the player currently overlaps.
+
+        The overlap test runs inside ``Rect.collidelistall``, so only real
+        hits reach the Python resolution loops. Callers still re-check each
+        hit, since resolving one collision moves the player.
+        """
+        candidates = self.nearby_platforms(self.rect)
+        return [candidates[i] for i in self.rect.collidelistall(candidates)]
 
     def handle_horizontal_collisions(self):
         """Resolve horizontal collisions with platforms."""
-        collisions = pygame.sprite.spritecollide(self, self.platforms, False)
-        for plat in collisions:
-            if self.vel_x > 0:
-                self.rect.right = plat.rect.left
-            elif self.vel_x < 0:
-                self.rect.left = plat.rect.right
+        for plat in self.overlapping_platforms():
+            if self.rect.colliderect(plat):
+                if self.vel_x > 0:
+                    self.rect.right = plat.left
+                elif self.vel_x < 0:
+                    self.rect.left = plat.right
 
     def handle_vertical_collisions(self):
         """Resolve vertical collisions with platforms using a two‑pass approach.
@@ -291,34 +334,37 @@ class Player(pygame.sprite.Sprite):
         # Reset grounded state each frame
         self.on_ground = False
         # First pass: resolve actual overlaps from vertical motion
-        collisions = pygame.sprite.spritecollide(self, self.platforms, False)
-        for plat in collisions:
+        for plat in self.overlapping_platforms():
+            if not self.rect.colliderect(plat):
+                continue
             if self.vel_y > 0:
                 # Falling down; clamp feet to platform top
-                self.rect.bottom = plat.rect.top
+                self.rect.bottom = plat.top
                 self.vel_y = 0
                 self.on_ground = True
             elif self.vel_y < 0:
                 # Moving up; bump head on underside
-                self.rect.top = plat.rect.bottom
+                self.rect.top = plat.bottom
                 self.vel_y = 0
         # Second pass: if we didn't land via overlap but our vertical
         # velocity is nearly zero, check if we're almost exactly on a
         # platform. Snap to its top if so to stay grounded.
         if not self.on_ground and abs(self.vel_y) < 1e-3:
-            for plat in self.platforms:
+            # only platforms whose top lies within the snap band below our feet
+            feet = pygame.Rect(self.rect.left, self.rect.bottom, self.rect.width, 4)
+            for plat in self.nearby_platforms(feet):
                 # horizontal overlap check
-                if self.rect.right > plat.rect.left and self.rect.left < plat.rect.right:
-                    delta = plat.rect.top - self.rect.bottom
+                if self.rect.right > plat.left and self.rect.left < plat.right:
+                    delta = plat.top - self.rect.bottom
                     if 0 <= delta <= 3:
-                        self.rect.bottom = plat.rect.top
+                        self.rect.bottom = plat.top
                         self.on_ground = True
                         break
 
-    def animate(self):
+    def animate(self, ticks: int):
         """Choose the correct frame based on movement and action."""
         # Determine which image set to use based on facing direction
-        images = self.images_right if self.direction > 0 else self.images_left
+        images = self.images_by_dir[self.direction > 0]
         
         # Attack overrides all other animations
         if self.attacking:
@@ -330,7 +376,7 @@ class Player(pygame.sprite.Sprite):
                 # cycling through run frames 1-3
                 run_cycle = [1, 2, 3]
                 # increment animation timer based on time
-                frame = int(pygame.time.get_ticks() / 100) % len(run_cycle)
+                frame = int(ticks / 100) % len(run_cycle)
                 self.frame_index = run_cycle[frame]
             else:
                 self.frame_index = 0  # idle
@@ -352,9 +398,9 @@ class Game:
 
         # Load assets
         self.platform_img = load_image('platform.png')
-        self.background_img = load_image('background.png')
-        # Load and scale to screen height for parallax effect
-        self.bg_scaled = pygame.transform.scale(self.background_img, (self.background_img.get_width(), SCREEN_HEIGHT))
+        self.background_img = load_image('background.png', alpha=False)
+        # Screen-sized backdrop tile, repeated horizontally across the level
+        self.bg_tile = pygame.transform.scale(self.background_img, (SCREEN_WIDTH, SCREEN_HEIGHT))
         
         # Player images
         right_frames = [
@@ -365,6 +411,7 @@ class Game:
             load_image('player_jump.png'),
             load_image('player_attack.png'),
         ]
+        # Mirrored frames are built once here and shared, never per sprite
         left_frames = flip_images(right_frames)
         
         # Coin frames
@@ -372,22 +419,41 @@ class Game:
         
         # Enemy image
         self.enemy_img = load_image('enemy.png')
+        self.enemy_img_left = pygame.transform.flip(self.enemy_img, True, False)
         
         # Hearts for lives display
         self.heart_img = load_image('heart.png')
         self.heart_img = pygame.transform.scale(self.heart_img, (24, 24))
+
+        # Fonts are created once; HUD text is re-rendered only when it changes
+        self.score_font = pygame.font.SysFont('Arial', 24)
+        self.title_font = pygame.font.SysFont('Arial', 48)
+        self._last_score = None
+        self._last_level = None
+        self._score_surf = None
+        self._level_surf = None
         
         # Sprite groups
-        self.platforms = pygame.sprite.Group()
+        # Platforms never change during a level, so a plain list is enough
+        self.platforms: List[Platform] = []
+        # Platforms above the ground strip in spawn order, filled by load_level
+        self.non_ground_platforms: List[Platform] = []
         self.coins = pygame.sprite.Group()
         self.enemies = pygame.sprite.Group()
-        self.all_sprites = pygame.sprite.Group()
+        # Spatial hash of platform rects in world coordinates, rebuilt per level
+        self.platform_grid: Dict[Tuple[int, int], List[pygame.Rect]] = {}
+        # The ground is one solid strip per level, drawn from a pre-tiled
+        # surface; the rect is updated in place on each level load
+        self.ground_rect = pygame.Rect(0, 0, 0, 0)
+        self.ground_surface = None
         
         # Player
         # Placeholder spawn will be updated after loading level
-        self.player = Player(100, 100, self.platforms, self.coins, self.enemies,
+        self.player = Player(100, 100, self.platform_grid, self.ground_rect, self.coins, self.enemies,
                              right_frames, left_frames)
-        self.all_sprites.add(self.player)
+        # One (image, position) pair per heart at full health; the HUD blits
+        # a slice of this list sized to the remaining lives
+        self._heart_blits = [(self.heart_img, (10 + i * 28, 10)) for i in range(self.player.lives)]
         
         # Level management
         self.level_index = 0
@@ -397,6 +463,8 @@ class Game:
         # Game state flags
         self.game_over = False
         self.game_won = False
+        # Timestamp shared by every sprite for the current frame, set in run()
+        self.frame_ticks = 0
 
     def generate_levels(self, count: int) -> List[List[tuple]]:
         """Generate a list of level data; each level is a list of platform tuples (x, y)."""
@@ -408,87 +476,84 @@ class Game:
             # ground platform spanning entire level
             level_platforms.append((0, SCREEN_HEIGHT - 40))
             # randomly place platforms above ground
-            random.seed(i)
+            rng = random.Random(i)
             platform_count = 8 + i // 2
             for p in range(platform_count):
-                x = random.randint(50, width - 200)
+                x = rng.randint(50, width - 200)
                 # vary height between 200 and SCREEN_HEIGHT - 150
-                y = random.randint(200, SCREEN_HEIGHT - 150)
+                y = rng.randint(200, SCREEN_HEIGHT - 150)
                 level_platforms.append((x, y))
             levels.append(level_platforms)
         return levels
 
     def load_level(self, index: int):
         """Load level by index, resetting sprite groups and placing objects."""
-        self.platforms.empty()
+        self.platforms.clear()
         self.coins.empty()
         self.enemies.empty()
-        # Remove all sprites except player from all_sprites
-        for sprite in list(self.all_sprites):
-            if sprite is not self.player:
-                self.all_sprites.remove(sprite)
+        self.non_ground_platforms.clear()
         
         # Level data
         level_platforms = self.levels[index]
         # Determine world width as farthest platform plus margin
         self.world_width = max([x for x, _ in level_platforms]) + 500
         
-        # Resize background to span the entire level width.  This
-        # creates a large static backdrop that is revealed as the
-        # camera scrolls horizontally.  Without this call the
-        # background would only span the screen width and would
-        # appear to move relative to the platforms.
-        self.bg_scaled = pygame.transform.scale(self.background_img,
-                                                (self.world_width, SCREEN_HEIGHT))
-        
         # Spawn platforms
         for x, y in level_platforms:
             # If y is bottom (ground), tile the platform across the level
+            # once into a single surface backed by one collision rect
             if y >= SCREEN_HEIGHT - 40:
-                # tile across width
-                for tx in range(0, self.world_width, self.platform_img.get_width()):
-                    plat = Platform(tx, y, self.platform_img)
-                    self.platforms.add(plat)
-                    self.all_sprites.add(plat)
+                tile_w, tile_h = self.platform_img.get_size()
+                tile_xs = range(0, self.world_width, tile_w)
+                ground_width = len(tile_xs) * tile_w
+                self.ground_surface = pygame.Surface((ground_width, tile_h), pygame.SRCALPHA).convert_alpha()
+                self.ground_surface.blits([(self.platform_img, (tx, 0)) for tx in tile_xs], doreturn=False)
+                self.ground_rect.update(0, y, ground_width, tile_h)
             else:
                 plat = Platform(x, y, self.platform_img)
-                self.platforms.add(plat)
-                self.all_sprites.add(plat)
+                self.platforms.append(plat)
+                self.non_ground_platforms.append(plat)
+        
+        # Bucket platform rects into the spatial hash. Platforms never move,
+        # so the grid stays valid for the whole level.
+        self.platform_grid.clear()
+        for plat in self.platforms:
+            for cell in grid_cells(plat.rect):
+                self.platform_grid.setdefault(cell, []).append(plat.rect)
         
         # Spawn coins randomly on some platforms (not ground)
         coin_count = 6 + index // 2
-        platform_list = [p for p in self.platforms if p.rect.y < SCREEN_HEIGHT - 50]
-        random.seed(index + 100)
+        platform_list = self.non_ground_platforms
+        rng = random.Random(index + 100)
         for _ in range(min(coin_count, len(platform_list))):
-            plat = random.choice(platform_list)
+            plat = rng.choice(platform_list)
             coin_x = plat.rect.centerx
             coin_y = plat.rect.top
-            coin = Coin(coin_x, coin_y, self.coin_frames)
+            coin = Coin(coin_x, coin_y, self.coin_frames[0])
             self.coins.add(coin)
-            self.all_sprites.add(coin)
         
         # Spawn enemies on some platforms (not ground)
         enemy_count = 3 + index // 3
-        random.seed(index + 200)
+        rng = random.Random(index + 200)
         for _ in range(min(enemy_count, len(platform_list))):
-            plat = random.choice(platform_list)
+            plat = rng.choice(platform_list)
             ex = plat.rect.centerx
             ey = plat.rect.top
-            enemy = Enemy(ex, ey, self.platforms, self.enemy_img)
+            enemy = Enemy(ex, ey, self.platform_grid, self.enemy_img, self.enemy_img_left, rng)
             self.enemies.add(enemy)
-            self.all_sprites.add(enemy)
         
         # Position player on first platform (not ground) or fallback
-        spawn_plats = [p for p in self.platforms if p.rect.y < SCREEN_HEIGHT - 50]
-        if spawn_plats:
-            spawn_plats.sort(key=lambda p: (p.rect.y, p.rect.x))
-            plat = spawn_plats[0]
+        if self.non_ground_platforms:
+            plat = min(self.non_ground_platforms, key=lambda p: (p.rect.y, p.rect.x))
             self.player.rect.midbottom = (plat.rect.x + 20, plat.rect.top)
             self.player.vel_y = 0
         else:
             # default spawn
             self.player.rect.midbottom = (50, SCREEN_HEIGHT - 50)
         
+        # Restart the shared coin animation
+        self.coin_anim_counter = 0
+
         # Reset player state
         self.player.score = 0
         self.player.lives = 3
@@ -497,10 +562,8 @@ class Game:
 
     def handle_game_over(self):
         """Display game over screen and wait for restart key."""
-        font = pygame.font.SysFont('Arial', 48)
-        small_font = pygame.font.SysFont('Arial', 24)
-        game_over_text = font.render('Game Over', True, (255, 255, 255))
-        retry_text = small_font.render('Press R to Try Again', True, (200, 200, 200))
+        game_over_text = self.title_font.render('Game Over', True, (255, 255, 255))
+        retry_text = self.score_font.render('Press R to Try Again', True, (200, 200, 200))
         self.screen.blit(game_over_text, ((SCREEN_WIDTH - game_over_text.get_width()) // 2,
                                           SCREEN_HEIGHT // 3))
         self.screen.blit(retry_text, ((SCREEN_WIDTH - retry_text.get_width()) // 2,
@@ -508,7 +571,7 @@ class Game:
         pygame.display.flip()
         waiting = True
         while waiting and self.running:
-            for event in pygame.event.get():
+            for event in pygame.event.get(WAIT_EVENTS):
                 if event.type == pygame.QUIT:
                     self.running = False
                     waiting = False
@@ -517,14 +580,14 @@ class Game:
                     self.level_index = 0
                     self.load_level(self.level_index)
                     waiting = False
+            # Drop mouse motion and other events the screen ignores
+            pygame.event.clear()
             self.clock.tick(FPS)
 
     def handle_win(self):
         """Display win screen and wait for restart key."""
-        font = pygame.font.SysFont('Arial', 48)
-        small_font = pygame.font.SysFont('Arial', 24)
-        win_text = font.render('You Win!', True, (255, 255, 255))
-        retry_text = small_font.render('Press R to Play Again', True, (200, 200, 200))
+        win_text = self.title_font.render('You Win!', True, (255, 255, 255))
+        retry_text = self.score_font.render('Press R to Play Again', True, (200, 200, 200))
         self.screen.blit(win_text, ((SCREEN_WIDTH - win_text.get_width()) // 2,
                                     SCREEN_HEIGHT // 3))
         self.screen.blit(retry_text, ((SCREEN_WIDTH - retry_text.get_width()) // 2,
@@ -532,7 +595,7 @@ class Game:
         pygame.display.flip()
         waiting = True
         while waiting and self.running:
-            for event in pygame.event.get():
+            for event in pygame.event.get(WAIT_EVENTS):
                 if event.type == pygame.QUIT:
                     self.running = False
                     waiting = False
@@ -540,108 +603,143 @@ class Game:
                     self.level_index = 0
                     self.load_level(self.level_index)
                     waiting = False
+            # Drop mouse motion and other events the screen ignores
+            pygame.event.clear()
             self.clock.tick(FPS)
 
+    def step(self, keys):
+        """Advance the simulation by one fixed timestep of ``DT`` seconds."""
+        if self.game_over or self.game_won:
+            return
+        # Handle input for player
+        self.player.handle_input(keys)
+        
+        # Update camera offset based on player position
+        camera_x = self.player.rect.centerx - SCREEN_WIDTH // 2
+        # Clamp camera
+        camera_x = max(0, min(camera_x, self.world_width - SCREEN_WIDTH))
+        self.last_camera_x = camera_x
+        
+        # Update sprites. Every sprite stays in world coordinates; the
+        # camera offset is only applied when drawing. Enemies well outside
+        # the viewport sleep until the camera comes near them.
+        self.player.update(self.frame_ticks)
+        active_left = camera_x - ENEMY_ACTIVE_MARGIN
+        active_right = camera_x + SCREEN_WIDTH + ENEMY_ACTIVE_MARGIN
+        for enemy in self.enemies:
+            if enemy.rect.right > active_left and enemy.rect.left < active_right:
+                enemy.update()
+        self.coin_anim_counter += 1
+        
+        # Check for level completion
+        if len(self.coins) == 0 and not self.game_over:
+            self.level_index += 1
+            if self.level_index >= len(self.levels):
+                self.game_won = True
+            else:
+                self.load_level(self.level_index)
+            return
+        
+        # Check for falling off screen
+        if self.player.rect.top > SCREEN_HEIGHT:
+            self.player.lives -= 1
+            # respawn on starting platform
+            if self.non_ground_platforms:
+                plat = self.non_ground_platforms[0]
+                self.player.rect.midbottom = (plat.rect.x + 20, plat.rect.top)
+                self.player.vel_y = 0
+                self.player.on_ground = True
+            if self.player.lives <= 0:
+                self.game_over = True
+
+    def draw(self):
+        """Render the current frame."""
+        # Draw background: a screen-sized tile anchored to world
+        # position.  Two blits at the camera offset modulo the tile
+        # width always cover the viewport, so it moves in sync with
+        # the level without keeping a level-wide surface in memory.
+        cam_x = getattr(self, 'last_camera_x', 0)
+        bg_offset = -cam_x % SCREEN_WIDTH
+        self.screen.blit(self.bg_tile, (bg_offset - SCREEN_WIDTH, 0))
+        self.screen.blit(self.bg_tile, (bg_offset, 0))
+        
+        # Draw sprites relative to camera, skipping anything outside the
+        # viewport. Visible platforms come straight from the spatial hash.
+        # Each layer is submitted as a single blits() call.
+        view_right = cam_x + SCREEN_WIDTH
+        view = pygame.Rect(cam_x, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        platform_img = self.platform_img
+        self.screen.blit(self.ground_surface, (self.ground_rect.x - cam_x, self.ground_rect.y))
+        self.screen.blits([(platform_img, (plat.x - cam_x, plat.y))
+                           for plat in query_grid(self.platform_grid, view)], doreturn=False)
+        coin_img = self.coin_frames[(self.coin_anim_counter // 10) % len(self.coin_frames)]
+        self.screen.blits([(coin_img, (coin.rect.x - cam_x, coin.rect.y))
+                           for coin in self.coins
+                           if coin.rect.right > cam_x and coin.rect.left < view_right], doreturn=False)
+        self.screen.blits([(enemy.image, (enemy.rect.x - cam_x, enemy.rect.y))
+                           for enemy in self.enemies
+                           if enemy.rect.right > cam_x and enemy.rect.left < view_right], doreturn=False)
+        # Draw player
+        self.screen.blit(self.player.image, (self.player.rect.x - cam_x, self.player.rect.y))
+        
+        # Draw HUD: lives and score
+        self.screen.blits(self._heart_blits[:max(self.player.lives, 0)], doreturn=False)
+        # Score text
+        if self.player.score != self._last_score:
+            self._score_surf = self.score_font.render(f'Score: {self.player.score}', True, (255, 255, 255))
+            self._last_score = self.player.score
+        self.screen.blit(self._score_surf, (10, 40))
+        # Level indicator
+        if self.level_index != self._last_level:
+            self._level_surf = self.score_font.render(f'Level: {self.level_index + 1}/{LEVEL_COUNT}', True,
+                                                      (255, 255, 255))
+            self._last_level = self.level_index
+        self.screen.blit(self._level_surf, (10, 70))
+        
+        # Flip display
+        pygame.display.flip()
+
     def run(self):
-        """Main game loop."""
+        """Main game loop.
+
+        The simulation advances in fixed ``DT`` steps fed by the real time
+        elapsed since the previous frame, so physics runs at the same speed
+        whatever the render rate. Rendering happens once per loop iteration.
+        A frame short of ``DT`` by less than the clock's 1 ms resolution
+        still steps, and the deficit is dropped rather than carried, so the
+        16 ms ticks of a 60 FPS clock do not skip a step every ~25 frames and
+        freeze the camera for a frame.
+        """
+        accumulator = 0.0
+        self.clock.tick()
         while self.running:
+            accumulator += min(self.clock.tick(FPS) / 1000.0, MAX_FRAME_TIME)
+            # Sampled once so every sprite animates from the same timestamp
+            self.frame_ticks = pygame.time.get_ticks()
             # Event handling
             keys = pygame.key.get_pressed()
-            for event in pygame.event.get():
+            # Only quit is handled here; everything else is discarded in C
+            for event in pygame.event.get(pygame.QUIT):
                 if event.type == pygame.QUIT:
                     self.running = False
+            pygame.event.clear()
             
-            # Handle input for player
-            if not self.game_over and not self.game_won:
-                self.player.handle_input(keys)
-            
-            # Update entities only if game is active
-            if not self.game_over and not self.game_won:
-                # Update camera offset based on player position
-                camera_x = self.player.rect.centerx - SCREEN_WIDTH // 2
-                # Clamp camera
-                camera_x = max(0, min(camera_x, self.world_width - SCREEN_WIDTH))
-                # Horizontal delta for this frame: how much the world has shifted
-                camera_dx = camera_x - getattr(self, 'last_camera_x', 0)
-                self.last_camera_x = camera_x
-                
-                # Update sprites
-                self.player.update()
-                for enemy in self.enemies:
-                    enemy.update(camera_dx)
-                self.coins.update()
-                
-                # Shift all platforms, coins, enemies relative to camera
-                for sprite in self.platforms:
-                    sprite.rect.x -= camera_dx
-                for sprite in self.coins:
-                    sprite.rect.x -= camera_dx
-                # Player shift done via drawing; we keep player's rect in world space
-                
-                # Check for level completion
-                if len(self.coins) == 0 and not self.game_over:
-                    self.level_index += 1
-                    if self.level_index >= len(self.levels):
-                        self.game_won = True
-                    else:
-                        self.load_level(self.level_index)
-                        continue
-                
-                # Check for falling off screen
-                if self.player.rect.top > SCREEN_HEIGHT:
-                    self.player.lives -= 1
-                    # respawn on starting platform
-                    spawn_plats = [p for p in self.platforms if p.rect.y < SCREEN_HEIGHT - 50]
-                    if spawn_plats:
-                        plat = spawn_plats[0]
-                        self.player.rect.midbottom = (plat.rect.x + 20, plat.rect.top)
-                        self.player.vel_y = 0
-                        self.player.on_ground = True
-                    if self.player.lives <= 0:
-                        self.game_over = True
-            
-            # Draw everything
-            # Draw background: a large static backdrop anchored to world
-            # position.  We shift it horizontally by the camera offset
-            # so that it moves in sync with the level instead of
-            # exhibiting a parallax effect.
-            cam_x = getattr(self, 'last_camera_x', 0)
-            self.screen.blit(self.bg_scaled, (-cam_x, 0))
+            while accumulator >= DT - TICK_SLACK:
+                self.step(keys)
+                accumulator = max(accumulator - DT, 0.0)
             
-            # Draw sprites relative to camera
-            for sprite in self.platforms:
-                self.screen.blit(sprite.image, sprite.rect)
-            for coin in self.coins:
-                self.screen.blit(coin.image, coin.rect)
-            for enemy in self.enemies:
-                self.screen.blit(enemy.image, enemy.rect)
-            # Draw player
-            # Player sprite in world space; adjust drawing position by camera_x
-            player_draw_x = self.player.rect.x - getattr(self, 'last_camera_x', 0)
-            self.screen.blit(self.player.image, (player_draw_x, self.player.rect.y))
+            self.draw()
             
-            # Draw HUD: lives and score
-            for i in range(self.player.lives):
-                self.screen.blit(self.heart_img, (10 + i * 28, 10))
-            # Score text
-            score_font = pygame.font.SysFont('Arial', 24)
-            score_surf = score_font.render(f'Score: {self.player.score}', True, (255, 255, 255))
-            self.screen.blit(score_surf, (10, 40))
-            # Level indicator
-            level_surf = score_font.render(f'Level: {self.level_index + 1}/{LEVEL_COUNT}', True, (255, 255, 255))
-            self.screen.blit(level_surf, (10, 70))
-            
-            # Flip display
-            pygame.display.flip()
-            
-            # Handle game over and win screens
+            # Handle game over and win screens. They block, so restart the
+            # accumulator rather than replaying the time spent on them.
             if self.game_over:
                 self.handle_game_over()
+                accumulator = 0.0
+                self.clock.tick()
             elif self.game_won:
                 self.handle_win()
-            
-            self.clock.tick(FPS)
-
+                accumulator = 0.0
+                self.clock.tick()
 
 if __name__ == '__main__':
     Game().run()
\ No newline at end of file
@@ -35,12 +35,17 @@ import sys
 import pygame
 
 
+# Width in pixels of one column of the uniform spatial grid
+GRID_CELL = 256
+
+
 def load_assets(asset_dir: str) -> dict:
     """Load all graphical and audio assets from the given directory.
 
     This function expects a specific set of files to be present. If
     any file is missing the program exits with an informative
-    message.
+    message. Images are converted to the display's pixel format, so
+    the display mode must be set before calling it.
 
     Parameters
     ----------
@@ -60,6 +65,8 @@ def load_assets(asset_dir: str) -> dict:
         'coin_anim1.png', 'coin_anim2.png',
         'coin_anim3.png', 'coin_anim4.png',
     ]
+    # Images without transparency are converted without an alpha channel
+    opaque_images = {'background_v3.png', 'platform_v2.png'}
     required_sounds = ['coin.wav', 'jump.wav', 'hurt.wav']
     assets: dict[str, object] = {}
     # Load images
@@ -68,7 +75,8 @@ def load_assets(asset_dir: str) -> dict:
         if not os.path.isfile(path):
             print(f"Required image asset '{fname}' missing from {asset_dir}.")
             sys.exit(1)
-        assets[fname] = pygame.image.load(path)
+        image = pygame.image.load(path)
+        assets[fname] = image.convert() if fname in opaque_images else image.convert_alpha()
     # Load sounds
     for fname in required_sounds:
         path = os.path.join(asset_dir, fname)
@@ -79,8 +87,32 @@ def load_assets(asset_dir: str) -> dict:
     return assets
 
 
+def grid_columns(left: int, right: int) -> range:
+    """Return the indices of the grid columns spanned by ``left``..``right``."""
+    return range(left // GRID_CELL, (right - 1) // GRID_CELL + 1)
+
+
+def build_grid(items: list, spans: list[tuple[int, int]]) -> dict[int, list]:
+    """Bucket ``items`` into grid columns by their horizontal ``(left, right)`` span."""
+    grid: dict[int, list] = {}
+    for item, (left, right) in zip(items, spans):
+        for col in grid_columns(left, right):
+            grid.setdefault(col, []).append(item)
+    return grid
+
+
+def query_grid(grid: dict[int, list], rect: pygame.Rect) -> list:
+    """Return the items in the grid columns overlapped by ``rect``, each once."""
+    found = {}
+    for col in grid_columns(rect.left, rect.right):
+        for item in grid.get(col, ()):
+            found[id(item)] = item
+    return list(found.values())
+
+
 class Player:
     """Main character controlled by the user."""
+    __slots__ = ('rect', 'frames', 'frame_index', 'frame_timer', 'vel_y', 'on_ground', 'jump_sound')
 
     def __init__(self, x: int, y: int, frames: list[pygame.Surface], jump_sound: pygame.mixer.Sound) -> None:
         self.rect = pygame.Rect(x, y, frames[0].get_width(), frames[0].get_height())
@@ -91,14 +123,10 @@ class Player:
         self.on_ground = False
         self.jump_sound = jump_sound
 
-    def handle_input(self) -> float:
-        """Process keyboard input and return horizontal movement delta."""
-        keys = pygame.key.get_pressed()
-        dx = 0.0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            dx = -5.0
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            dx = 5.0
+    def handle_input(self, keys) -> float:
+        """Process the frame's key state and return horizontal movement delta."""
+        # Opposing directions cancel out
+        dx = 5.0 * ((keys[pygame.K_RIGHT] or keys[pygame.K_d]) - (keys[pygame.K_LEFT] or keys[pygame.K_a]))
         if (keys[pygame.K_SPACE] or keys[pygame.K_w] or keys[pygame.K_UP]) and self.on_ground:
             self.vel_y = -12.0
             self.on_ground = False
@@ -122,6 +150,8 @@ class Player:
         self.rect.y += self.vel_y
         # Reset on_ground until collision resolves
         self.on_ground = False
+        # Either resolution zeroes vel_y, after which no other platform can
+        # match, so stop at the first one
         for plat in platforms:
             if self.rect.colliderect(plat):
                 # Falling down onto a platform
@@ -129,10 +159,12 @@ class Player:
                     self.rect.bottom = plat.top
                     self.vel_y = 0
                     self.on_ground = True
+                    break
                 # Jumping and hitting the underside
                 elif self.vel_y < 0 and self.rect.top - self.vel_y >= plat.bottom:
                     self.rect.top = plat.bottom
                     self.vel_y = 0
+                    break
 
         # Animate sprite (frame 0 is idle, others animate during movement)
         self.frame_timer += 1
@@ -140,9 +172,10 @@ class Player:
             self.frame_timer = 0
             self.frame_index = (self.frame_index + 1) % len(self.frames)
 
-    def draw(self, surface: pygame.Surface, offset_x: float) -> None:
+    def draw(self, surface: pygame.Surface, offset_x: int) -> pygame.Rect:
+        """Draw the current frame and return the screen area it covered."""
         frame = self.frames[self.frame_index]
-        surface.blit(frame, (self.rect.x - offset_x, self.rect.y))
+        return surface.blit(frame, (self.rect.x - offset_x, self.rect.y))
 
     def reset_position(self, x: int, y: int) -> None:
         """Reset the player's position and vertical velocity."""
@@ -153,20 +186,17 @@ class Player:
 
 
 class AnimatedCoin:
-    """A coin that cycles through animation frames."""
+    """A coin that cycles through animation frames.
+
+    All coins animate in step, so the frame to show is chosen once per
+    frame by the main loop and passed to ``draw``.
+    """
+    __slots__ = ('rect', 'sound')
     def __init__(self, x: int, y: int, frames: list[pygame.Surface], sound: pygame.mixer.Sound):
-        self.frames = frames
         self.rect = pygame.Rect(x, y, frames[0].get_width(), frames[0].get_height())
-        self.frame_index = 0
-        self.timer = 0
         self.sound = sound
-    def update(self) -> None:
-        self.timer += 1
-        if self.timer >= 10:
-            self.timer = 0
-            self.frame_index = (self.frame_index + 1) % len(self.frames)
-    def draw(self, surface: pygame.Surface, offset_x: float) -> None:
-        surface.blit(self.frames[self.frame_index], (self.rect.x - offset_x, self.rect.y))
+    def draw(self, surface: pygame.Surface, offset_x: int, frame: pygame.Surface) -> None:
+        surface.blit(frame, (self.rect.x - offset_x, self.rect.y))
     def collect(self) -> None:
         if self.sound:
             self.sound.play()
@@ -174,6 +204,7 @@ class AnimatedCoin:
 
 class Enemy:
     """An enemy that patrols horizontally along a platform."""
+    __slots__ = ('rect', 'min_x', 'max_x', 'speed', 'image', 'hurt_sound')
     def __init__(self, x: int, platform_y: int, min_x: int, max_x: int, image: pygame.Surface, hurt_sound: pygame.mixer.Sound):
         # Place enemy so it stands on top of the platform
         self.rect = pygame.Rect(
@@ -187,13 +218,20 @@ class Enemy:
         self.speed = 2
         self.image = image
         self.hurt_sound = hurt_sound
+    def reset_position(self, x: int, platform_y: int, min_x: int, max_x: int) -> None:
+        """Move the enemy onto a new platform and restart its patrol."""
+        self.rect.x = x
+        self.rect.bottom = platform_y
+        self.min_x = min_x
+        self.max_x = max_x
+        self.speed = 2
     def update(self) -> None:
         self.rect.x += self.speed
         if self.rect.x < self.min_x or self.rect.x > self.max_x:
             self.speed *= -1
             # clamp inside bounds to avoid overshoot
             self.rect.x = max(min(self.rect.x, self.max_x), self.min_x)
-    def draw(self, surface: pygame.Surface, offset_x: float) -> None:
+    def draw(self, surface: pygame.Surface, offset_x: int) -> None:
         surface.blit(self.image, (self.rect.x - offset_x, self.rect.y))
     def play_sound(self) -> None:
         if self.hurt_sound:
@@ -212,19 +250,18 @@ def generate_levels(num_levels: int, screen_height: int, platform_img: pygame.Su
     'platforms', 'coins', 'enemies', and 'length'.
     """
     levels: list[dict[str, object]] = []
+    # Sprite sizes are the same for every level; look them up once
+    enemy_w = enemy_img.get_width()
+    plat_w, plat_h = platform_img.get_size()
+    coin_w, coin_h = coin_frames[0].get_size()
+    base_y = screen_height - plat_h - 40
     for i in range(num_levels):
         level_length = 1400 + 300 * i
-        base_y = screen_height - platform_img.get_height() - 40
         num_platforms = 8 + i // 2
         step_x = max(220, (level_length - 200) // num_platforms)
         platforms: list[tuple[int, int]] = []
         coins: list[tuple[int, int]] = []
         enemies: list[tuple[int, int, int, int]] = []
-        # Determine enemy width for boundaries
-        enemy_w = enemy_img.get_width()
-        plat_w = platform_img.get_width()
-        coin_w = coin_frames[0].get_width()
-        coin_h = coin_frames[0].get_height()
         for j in range(num_platforms):
             x = 100 + j * step_x
             y_offset = -((j % 5) * 40)
@@ -288,41 +325,99 @@ def main() -> None:
         enemy_img=enemy_img,
     )
 
-    # Font
+    # Pre-compose enough background tiles side by side to cover the
+    # viewport at any parallax shift, so each frame needs one blit
+    bg_width = background.get_width()
+    bg_tiles = -(-screen_width // bg_width) + 1
+    bg_strip = pygame.Surface((bg_width * bg_tiles, screen_height)).convert()
+    bg_strip.blits([(background, (i * bg_width, 0)) for i in range(bg_tiles)], doreturn=False)
+
+    # Font. HUD text is only re-rendered when its value changes.
     font = pygame.font.SysFont(None, 36)
+    score_surf = level_surf = None
+    rendered_score = rendered_level = None
 
     # Game state
     current_level = 0
     score = 0
     lives = 3
+    # Heart icons for a full set of lives, right-aligned; the HUD draws a
+    # slice sized to the remaining lives
+    heart_w = heart_img.get_width()
+    heart_blits = [(heart_img, (screen_width - (i + 1) * (heart_w + 10) - 15, 15)) for i in range(lives)]
     game_over = False
     game_completed = False
 
+    # Platform rects, coins and enemies are allocated once for the busiest
+    # level and repositioned on every level load instead of recreated
+    platform_size = platform_img.get_size()
+    platform_pool = [
+        pygame.Rect((0, 0), platform_size)
+        for _ in range(max(len(level['platforms']) for level in levels))
+    ]
+    coin_pool = [
+        AnimatedCoin(0, 0, coin_frames, coin_sound)
+        for _ in range(max(len(level['coins']) for level in levels))
+    ]
+    enemy_pool = [
+        Enemy(0, 0, 0, 0, enemy_img, hurt_sound)
+        for _ in range(max(len(level['enemies']) for level in levels))
+    ]
+
     def load_level(index: int):
         data = levels[index]
-        pl_rects = [
-            pygame.Rect(x, y, platform_img.get_width(), platform_img.get_height())
-            for x, y in data['platforms']
-        ]
-        coin_objs = [AnimatedCoin(x, y, coin_frames, coin_sound) for x, y in data['coins']]
-        enemy_objs = [
-            Enemy(x, py, min_x, max_x, enemy_img, hurt_sound)
-            for (x, py, min_x, max_x) in data['enemies']
-        ]
-        return pl_rects, coin_objs, enemy_objs, data['length']
-
-    platforms, coins, enemies, level_length = load_level(current_level)
+        pl_rects = platform_pool[:len(data['platforms'])]
+        for rect, (x, y) in zip(pl_rects, data['platforms']):
+            rect.topleft = (x, y)
+        coin_objs = coin_pool[:len(data['coins'])]
+        for coin, (x, y) in zip(coin_objs, data['coins']):
+            coin.rect.topleft = (x, y)
+        enemy_objs = enemy_pool[:len(data['enemies'])]
+        for enemy, (x, py, min_x, max_x) in zip(enemy_objs, data['enemies']):
+            enemy.reset_position(x, py, min_x, max_x)
+        # Platforms and coins never move; enemies are bucketed by their
+        # whole patrol range so the grid stays valid as they walk
+        grids = (
+            build_grid(pl_rects, [(r.left, r.right) for r in pl_rects]),
+            build_grid(coin_objs, [(c.rect.left, c.rect.right) for c in coin_objs]),
+            build_grid(enemy_objs, [(e.min_x, e.max_x + e.rect.width) for e in enemy_objs]),
+        )
+        # The level's (x, y) platform positions double as the static draw
+        # list, so drawing needs no Rect attribute lookups per frame
+        return data['platforms'], coin_objs, enemy_objs, data['length'], grids
+
+    platform_positions, coins, enemies, level_length, grids = load_level(current_level)
+    plat_grid, coin_grid, enemy_grid = grids
+    # Shared coin animation clock, restarted on every level load
+    coin_tick = 0
+    coin_frame = coin_frames[0]
     player = Player(100, screen_height - 200, player_frames, jump_sound)
-    offset_x = 0.0
+    # Camera offset in whole pixels, so every draw position is an int
+    offset_x = 0
+    # Screen areas touched by moving sprites and HUD on the previous frame,
+    # and the camera/level they were drawn with; see the end of the loop
+    prev_dirty: list[pygame.Rect] = []
+    drawn_view = None
+    end_screen_shown = False
 
     while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return
+        # Key state is read once per frame and shared by everything below
+        keys = pygame.key.get_pressed()
+
+        # The end-of-game screen is static once drawn: just wait for Escape
+        # at a lower frame rate without redrawing anything
+        if end_screen_shown:
+            if keys[pygame.K_ESCAPE]:
+                return
+            clock.tick(30)
+            continue
 
         if not game_over and not game_completed:
             # Input
-            dx = player.handle_input()
+            dx = player.handle_input(keys)
             # Horizontal movement
             player.rect.x += dx
             # Prevent leaving world boundaries horizontally
@@ -331,30 +426,36 @@ def main() -> None:
             if player.rect.x > level_length - player.rect.width:
                 player.rect.x = level_length - player.rect.width
             # Apply gravity and vertical movement/collisions
-            player.update(platforms)
+            player.update(query_grid(plat_grid, player.rect))
 
-            # Update coins and enemies
-            for coin in coins:
-                coin.update()
+            # Advance the shared coin animation and update enemies
+            coin_tick += 1
+            coin_frame = coin_frames[(coin_tick // 10) % len(coin_frames)]
             for enemy in enemies:
                 enemy.update()
 
             # Check coin collection
-            for coin in coins[:]:
-                if player.rect.colliderect(coin.rect):
+            collected = [coin for coin in query_grid(coin_grid, player.rect)
+                         if player.rect.colliderect(coin.rect)]
+            if collected:
+                for coin in collected:
                     score += 1
                     coin.collect()
-                    coins.remove(coin)
-
-            # Check enemy collision
-            for enemy in enemies:
-                if player.rect.colliderect(enemy.rect):
-                    enemy.play_sound()
-                    lives -= 1
-                    # reset to start of level
-                    player.reset_position(100, screen_height - 200)
-                    offset_x = 0
-                    break
+                    for col in grid_columns(coin.rect.left, coin.rect.right):
+                        coin_grid[col].remove(coin)
+                # Rebuild the survivors in one pass rather than list.remove per coin
+                coins = [coin for coin in coins if coin not in collected]
+
+            # Check enemy collision; collidelist tests every nearby enemy in
+            # one call and reports the first hit
+            nearby_enemies = query_grid(enemy_grid, player.rect)
+            hit = player.rect.collidelist([enemy.rect for enemy in nearby_enemies])
+            if hit != -1:
+                nearby_enemies[hit].play_sound()
+                lives -= 1
+                # reset to start of level
+                player.reset_position(100, screen_height - 200)
+                offset_x = 0
             # Check lives
             if lives <= 0:
                 game_over = True
@@ -365,7 +466,10 @@ def main() -> None:
                 if current_level >= len(levels):
                     game_completed = True
                 else:
-                    platforms, coins, enemies, level_length = load_level(current_level)
+                    platform_positions, coins, enemies, level_length, grids = load_level(current_level)
+                    plat_grid, coin_grid, enemy_grid = grids
+                    coin_tick = 0
+                    coin_frame = coin_frames[0]
                     player.reset_position(100, screen_height - 200)
                     offset_x = 0
 
@@ -388,30 +492,28 @@ def main() -> None:
 
         # Drawing
         # Draw scrolling background with parallax
-        bg_width = background.get_width()
-        for i in range(int(level_length / bg_width) + 2):
-            screen.blit(background, (i * bg_width - offset_x * 0.5, 0))
+        screen.blit(bg_strip, (-(offset_x // 2 % bg_width), 0))
+        # Each remaining layer is submitted to pygame as a single blits() call
         # Platforms
-        for plat in platforms:
-            screen.blit(platform_img, (plat.x - offset_x, plat.y))
-        # Coins
-        for coin in coins:
-            coin.draw(screen, offset_x)
-        # Enemies
-        for enemy in enemies:
-            enemy.draw(screen, offset_x)
+        screen.blits([(platform_img, (x - offset_x, y)) for x, y in platform_positions], doreturn=False)
+        # Coins and enemies; the blitted areas are kept as dirty rects
+        dirty = screen.blits([(coin_frame, (coin.rect.x - offset_x, coin.rect.y))
+                              for coin in coins])
+        dirty += screen.blits([(enemy.image, (enemy.rect.x - offset_x, enemy.rect.y))
+                               for enemy in enemies])
         # Player
-        player.draw(screen, offset_x)
+        dirty.append(player.draw(screen, offset_x))
         # UI: score and level
-        score_surf = font.render(f"Score: {score}", True, (0, 0, 0))
-        level_surf = font.render(f"Level: {current_level + 1} / {len(levels)}", True, (0, 0, 0))
-        screen.blit(score_surf, (15, 15))
-        screen.blit(level_surf, (15, 50))
+        if score != rendered_score:
+            score_surf = font.render(f"Score: {score}", True, (0, 0, 0))
+            rendered_score = score
+        if current_level != rendered_level:
+            level_surf = font.render(f"Level: {current_level + 1} / {len(levels)}", True, (0, 0, 0))
+            rendered_level = current_level
+        dirty.append(screen.blit(score_surf, (15, 15)))
+        dirty.append(screen.blit(level_surf, (15, 50)))
         # Draw lives as hearts
-        for i in range(lives):
-            x = screen_width - (i + 1) * (heart_img.get_width() + 10) - 15
-            y = 15
-            screen.blit(heart_img, (x, y))
+        dirty += screen.blits(heart_blits[:max(lives, 0)])
 
         # Game over or completion messages
         if game_over:
@@ -425,12 +527,22 @@ def main() -> None:
             screen.blit(msg, ((screen_width - msg.get_width()) // 2, (screen_height - msg.get_height()) // 2))
             screen.blit(sub, ((screen_width - sub.get_width()) // 2, (screen_height - sub.get_height()) // 2 + 40))
 
-        pygame.display.flip()
+        # While the camera holds still the scenery is unchanged, so only the
+        # areas sprites and HUD covered this frame or the last one are pushed
+        # to the display. Scrolling, a level change or an overlay message
+        # changes the whole view and needs a full flip.
+        view = (offset_x, current_level)
+        if view == drawn_view and not (game_over or game_completed):
+            pygame.display.update(prev_dirty + dirty)
+        else:
+            pygame.display.flip()
+        prev_dirty = dirty
+        drawn_view = view
+        end_screen_shown = game_over or game_completed
         clock.tick(60)
 
         # Allow escape key to quit when game is over/completed
         if game_over or game_completed:
-            keys = pygame.key.get_pressed()
             if keys[pygame.K_ESCAPE]:
                 return
 
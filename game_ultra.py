@@ -29,10 +29,25 @@ life. When all lives are spent the game ends.
 
 import os
 import sys
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+
 import pygame
 
 
+STEP = 1 / 60.0  # fixed physics step in seconds; movement constants are per step
+MAX_FRAME_TIME = 0.25  # clamp long frames so the simulation cannot spiral
+TICK_SLACK = 0.001  # clock.tick() reports whole milliseconds
+JUMP_KEYS = (pygame.K_SPACE, pygame.K_UP, pygame.K_w)
+
+
 def load_assets(asset_dir: str) -> dict:
+    """Load every image and sound the game needs from ``asset_dir``.
+
+    Images are converted to the display's pixel format, so the display
+    mode must be set before this is called. Sounds are read and decoded
+    on worker threads while the images load.
+    """
     required_images = [
         'background_v3.png', 'platform_v3.png',
         'player_idle_v3.png', 'player_run1_v3.png',
@@ -41,24 +56,60 @@ def load_assets(asset_dir: str) -> dict:
         'coin_anim1.png', 'coin_anim2.png',
         'coin_anim3.png', 'coin_anim4.png',
     ]
+    # Images without transparency are converted without an alpha channel
+    opaque_images = {'background_v3.png', 'platform_v3.png'}
     required_sounds = ['coin.wav', 'jump.wav', 'hurt.wav']
     assets: dict[str, object] = {}
-    for fname in required_images:
-        path = os.path.join(asset_dir, fname)
-        if not os.path.isfile(path):
-            print(f"Missing image asset: {fname}")
-            sys.exit(1)
-        assets[fname] = pygame.image.load(path)
-    for fname in required_sounds:
-        path = os.path.join(asset_dir, fname)
-        if not os.path.isfile(path):
-            print(f"Missing sound asset: {fname}")
-            sys.exit(1)
-        assets[fname] = pygame.mixer.Sound(path)
+    with ThreadPoolExecutor(max_workers=len(required_sounds)) as pool:
+        pending_sounds = {}
+        for fname in required_sounds:
+            path = os.path.join(asset_dir, fname)
+            if not os.path.isfile(path):
+                print(f"Missing sound asset: {fname}")
+                sys.exit(1)
+            pending_sounds[fname] = pool.submit(pygame.mixer.Sound, path)
+        for fname in required_images:
+            path = os.path.join(asset_dir, fname)
+            if not os.path.isfile(path):
+                print(f"Missing image asset: {fname}")
+                sys.exit(1)
+            image = pygame.image.load(path)
+            assets[fname] = image.convert() if fname in opaque_images else image.convert_alpha()
+        for fname, sound in pending_sounds.items():
+            assets[fname] = sound.result()
     return assets
 
 
+class XSweep:
+    """Objects kept sorted by the left edge of their rect for x-range queries.
+
+    This is the broad phase of a sweep-and-prune: only objects whose
+    horizontal span can reach the queried range are returned, and the
+    caller runs the exact rectangle tests on that short list.
+    """
+    def __init__(self, items: list, rects: list[pygame.Rect]) -> None:
+        order = sorted(range(len(items)), key=lambda i: rects[i].left)
+        self.items = [items[i] for i in order]
+        self.lefts = [rects[i].left for i in order]
+        self.max_width = max((rect.width for rect in rects), default=0)
+    def query(self, left: float, right: float) -> list:
+        """Return the objects that may overlap the x-range ``left``..``right``."""
+        lo = bisect_right(self.lefts, left - self.max_width)
+        hi = bisect_left(self.lefts, right, lo)
+        return self.items[lo:hi]
+    def remove(self, item, left: int) -> None:
+        """Remove ``item``, whose rect's left edge is ``left``."""
+        i = bisect_left(self.lefts, left)
+        while self.items[i] is not item:
+            i += 1
+        del self.items[i]
+        del self.lefts[i]
+
+
 class Player:
+    # Next frame while running, indexed by the current frame.  Frames are
+    # [idle, run1, run2, run3]; idle starts the run cycle at run1.
+    _next_run = (1, 2, 3, 1)
     def __init__(self, x: int, y: int, frames: list[pygame.Surface], jump_sound: pygame.mixer.Sound) -> None:
         self.rect = pygame.Rect(x, y, frames[0].get_width(), frames[0].get_height())
         self.frames = frames
@@ -67,14 +118,18 @@ class Player:
         self.vel_y = 0.0
         self.on_ground = False
         self.jump_sound = jump_sound
-    def handle_input(self) -> float:
-        keys = pygame.key.get_pressed()
+    def handle_input(self, keys, jump_pressed: bool) -> float:
+        """Apply the frame's key state and return horizontal movement delta.
+
+        ``jump_pressed`` is true when a jump key went down since the last
+        step, so holding the key does not jump again on landing.
+        """
         dx = 0.0
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
             dx = -5.0
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
             dx = 5.0
-        if (keys[pygame.K_SPACE] or keys[pygame.K_UP] or keys[pygame.K_w]) and self.on_ground:
+        if jump_pressed and self.on_ground:
             self.vel_y = -12.0
             self.on_ground = False
             if self.jump_sound:
@@ -89,10 +144,10 @@ class Player:
         Update the player's position, apply physics and resolve
         collisions.  Horizontal motion is handled first followed by
         gravity and vertical motion.  Collisions on the vertical axis
-        are resolved using a two‑step approach: direct collision
-        detection to snap onto or bump off of platforms when moving
-        vertically, followed by a secondary contact check that keeps
-        the player attached to a platform when they are already
+        are resolved in one pass over the platforms that combines
+        direct collision detection, to snap onto or bump off of
+        platforms when moving vertically, with a contact check that
+        keeps the player attached to a platform when they are already
         standing on it but minor rounding errors or zero velocity
         prevent an actual rectangle overlap.  This improves the
         reliability of standing on platforms and prevents the player
@@ -118,8 +173,13 @@ class Player:
 
         # Reset grounded state each frame; will be set to True when on a platform.
         self.on_ground = False
-        landed = False
-        # First pass: resolve any actual rectangle overlaps caused by the vertical move.
+        # Single pass over the platforms.  An actual rectangle overlap from
+        # the vertical move snaps the player onto the platform (falling) or
+        # bumps their head on its underside (rising).  Without an overlap,
+        # if vertical velocity has come to rest, a platform whose top lies
+        # within a small epsilon below the player's feet counts as contact:
+        # this covers the player sitting exactly on a platform top due to
+        # discrete movement.  Landing either way ends the pass.
         for plat in platforms:
             if self.rect.colliderect(plat):
                 if self.vel_y > 0:
@@ -127,29 +187,17 @@ class Player:
                     self.rect.bottom = plat.top
                     self.vel_y = 0
                     self.on_ground = True
-                    landed = True
+                    break
                 elif self.vel_y < 0:
                     # Moving up: bump head on underside of platform
                     self.rect.top = plat.bottom
                     self.vel_y = 0
-                # We break here intentionally only for the falling case;
-                # but continue checking other overlaps when moving up.
-        # Second pass: if we did not land via overlap but vertical
-        # velocity has come to rest (i.e. 0), check if the player's
-        # feet are aligned with a platform within a small epsilon.  If
-        # so, snap to the platform and treat as grounded.  This covers
-        # the case where the player's bottom sits exactly at the
-        # platform top without overlapping due to discrete movement.
-        if not self.on_ground and abs(self.vel_y) < 1e-3:
-            for plat in platforms:
-                # Check horizontal overlap
-                if self.rect.right > plat.left and self.rect.left < plat.right:
-                    # Check if we are almost exactly on top of this platform
-                    delta = plat.top - self.rect.bottom
-                    if 0 <= delta <= 3:
-                        self.rect.bottom = plat.top
-                        self.on_ground = True
-                        break
+            elif (abs(self.vel_y) < 1e-3
+                  and self.rect.right > plat.left and self.rect.left < plat.right
+                  and 0 <= plat.top - self.rect.bottom <= 3):
+                self.rect.bottom = plat.top
+                self.on_ground = True
+                break
 
         # Animate frames: use idle frame when not moving horizontally.  Skip
         # the idle frame when running.
@@ -157,14 +205,14 @@ class Player:
             self.frame_timer += 1
             if self.frame_timer >= 8:
                 self.frame_timer = 0
-                # Skip frame 0 (idle) when running.  Frames list is
-                # [idle, run1, run2, run3]; cycling through run1..run3.
-                self.frame_index = (self.frame_index + 1) % (len(self.frames) - 1) + 1
+                # Skip frame 0 (idle) when running; cycle run1..run3.
+                self.frame_index = Player._next_run[self.frame_index]
         else:
             self.frame_index = 0
-    def draw(self, surface: pygame.Surface, offset_x: float) -> None:
+    def draw(self, surface: pygame.Surface, offset_x: float) -> pygame.Rect:
+        """Draw the current frame and return the screen area it covered."""
         frame = self.frames[self.frame_index]
-        surface.blit(frame, (self.rect.x - offset_x, self.rect.y))
+        return surface.blit(frame, (self.rect.x - offset_x, self.rect.y))
     def reset_position(self, x: int, y: int) -> None:
         """
         Reset the player's position to a given x, y coordinate and
@@ -188,19 +236,14 @@ class Player:
 
 
 class AnimatedCoin:
+    # All coins animate in lockstep, so the current frame is kept by the game
+    # loop and passed in at draw time
+    __slots__ = ('rect', 'sound')
     def __init__(self, x: int, y: int, frames: list[pygame.Surface], sound: pygame.mixer.Sound):
-        self.frames = frames
         self.rect = pygame.Rect(x, y, frames[0].get_width(), frames[0].get_height())
-        self.frame_index = 0
-        self.timer = 0
         self.sound = sound
-    def update(self) -> None:
-        self.timer += 1
-        if self.timer >= 10:
-            self.timer = 0
-            self.frame_index = (self.frame_index + 1) % len(self.frames)
-    def draw(self, surface: pygame.Surface, offset_x: float) -> None:
-        surface.blit(self.frames[self.frame_index], (self.rect.x - offset_x, self.rect.y))
+    def draw(self, surface: pygame.Surface, offset_x: float, frame: pygame.Surface) -> pygame.Rect:
+        return surface.blit(frame, (self.rect.x - offset_x, self.rect.y))
     def collect(self) -> None:
         if self.sound:
             self.sound.play()
@@ -219,8 +262,8 @@ class Enemy:
         if self.rect.x < self.min_x or self.rect.x > self.max_x:
             self.speed *= -1
             self.rect.x = max(min(self.rect.x, self.max_x), self.min_x)
-    def draw(self, surface: pygame.Surface, offset_x: float) -> None:
-        surface.blit(self.image, (self.rect.x - offset_x, self.rect.y))
+    def draw(self, surface: pygame.Surface, offset_x: float) -> pygame.Rect:
+        return surface.blit(self.image, (self.rect.x - offset_x, self.rect.y))
     def play_sound(self) -> None:
         if self.sound:
             self.sound.play()
@@ -233,29 +276,17 @@ def generate_levels(num_levels: int, screen_height: int, platform_img: pygame.Su
     enemy_w = enemy_img.get_width()
     coin_w = coin_frames[0].get_width()
     coin_h = coin_frames[0].get_height()
+    base_y = screen_height - platform_img.get_height() - 80
     for i in range(num_levels):
         length = 1600 + 250 * i  # steadily increase length
-        base_y = screen_height - platform_img.get_height() - 80
         num_platforms = 10 + i // 3
         step = max(180, (length - 200) // num_platforms)
-        platforms = []
-        coins = []
-        enemies = []
-        for j in range(num_platforms):
-            x = 100 + j * step
-            # smaller vertical variation for easier jumps
-            y_offset = -((j % 4) * 30)
-            y = base_y + y_offset
-            platforms.append((x, y))
-            # place coin above every 2nd platform
-            if j % 2 == 0:
-                coins.append((x + (plat_w - coin_w)//2, y - coin_h - 10))
-            # place enemy on every 4th platform
-            if j % 4 == 1:
-                min_x = x
-                max_x = x + plat_w - enemy_w
-                enemy_x = x + (plat_w - enemy_w)//2
-                enemies.append((enemy_x, y, min_x, max_x))
+        # smaller vertical variation for easier jumps
+        platforms = [(100 + j * step, base_y - (j % 4) * 30) for j in range(num_platforms)]
+        # place coin above every 2nd platform
+        coins = [(x + (plat_w - coin_w)//2, y - coin_h - 10) for x, y in platforms[::2]]
+        # place enemy on every 4th platform, patrolling its full width
+        enemies = [(x + (plat_w - enemy_w)//2, y, x, x + plat_w - enemy_w) for x, y in platforms[1::4]]
         levels.append({'platforms': platforms, 'coins': coins, 'enemies': enemies, 'length': length})
     return levels
 
@@ -266,6 +297,9 @@ def main() -> None:
     pygame.display.set_caption("Ultra Platformer")
     screen_width, screen_height = 1000, 600
     screen = pygame.display.set_mode((screen_width, screen_height))
+    # Jumps come from KEYDOWN events; key repeat would turn a held key into
+    # a stream of presses
+    pygame.key.set_repeat()
     clock = pygame.time.Clock()
     asset_dir = os.path.dirname(__file__)
     assets = load_assets(asset_dir)
@@ -288,9 +322,22 @@ def main() -> None:
     coin_sound = assets['coin.wav']
     jump_sound = assets['jump.wav']
     hurt_sound = assets['hurt.wav']
+    # Pre-compose enough background tiles side by side to cover the
+    # viewport at any parallax shift, so each frame needs one blit
+    bg_w = background.get_width()
+    bg_tiles = -(-screen_width // bg_w) + 1
+    bg_strip = pygame.Surface((bg_w * bg_tiles, screen_height)).convert()
+    bg_strip.blits([(background, (i * bg_w, 0)) for i in range(bg_tiles)], doreturn=False)
     # Generate levels
     levels = generate_levels(30, screen_height, platform_img, coin_frames, enemy_img)
     font = pygame.font.SysFont(None, 32)
+    # HUD text is only re-rendered when its value changes; the end-of-game
+    # messages never change, so they are rendered once up front
+    score_surf = level_surf = None
+    rendered_score = rendered_level = None
+    over_surf = font.render("Game Over", True, (200,0,0))
+    win_surf = font.render("You Win!", True, (0,150,0))
+    exit_surf = font.render("Press Esc to exit", True, (0,0,0))
     current_level = 0
     score = 0
     lives = 3
@@ -301,58 +348,100 @@ def main() -> None:
         pl_rects = [pygame.Rect(x,y,platform_img.get_width(),platform_img.get_height()) for x,y in data['platforms']]
         coin_objs = [AnimatedCoin(x,y,coin_frames, coin_sound) for x,y in data['coins']]
         enemy_objs = [Enemy(x,py,min_x,max_x, enemy_img, hurt_sound) for (x,py,min_x,max_x) in data['enemies']]
-        return pl_rects, coin_objs, enemy_objs, data['length']
-    platforms, coins, enemies, level_length = load_level(current_level)
+        # x-sorted broad phase for the static platforms and the coins
+        plat_sweep = XSweep(pl_rects, pl_rects)
+        coin_sweep = XSweep(coin_objs, [coin.rect for coin in coin_objs])
+        # Platforms never move within a level, so they are baked once into a
+        # transparent layer covering just the band of heights they occupy
+        band = pl_rects[0].unionall(pl_rects)
+        platform_layer = pygame.Surface((band.right, band.height), pygame.SRCALPHA).convert_alpha()
+        platform_layer.blits([(platform_img, (r.x, r.y - band.top)) for r in pl_rects], doreturn=False)
+        # The coin sweep is the only store of a level's uncollected coins
+        return (pl_rects, enemy_objs, data['length'], plat_sweep, coin_sweep,
+                platform_layer, band.top)
+    (platforms, enemies, level_length, plat_sweep, coin_sweep,
+     platform_layer, platform_layer_y) = load_level(current_level)
     # align player on first platform
     spawn_x = platforms[0].x + 10
     spawn_y = platforms[0].y - player_frames[0].get_height()
     player = Player(spawn_x, spawn_y, player_frames, jump_sound)
     offset_x = 0.0
-    while True:
+    # shared coin animation clock, restarted with each level
+    coin_tick = 0
+    coin_frame = coin_frames[0]
+    # Gameplay loop: runs until the game is lost or won. Physics advances in
+    # fixed STEP increments fed by real elapsed time, so game speed does not
+    # depend on the render rate; rendering happens once per loop. A frame
+    # short of STEP by less than the clock's 1 ms resolution still steps, and
+    # the deficit is dropped rather than carried: a 16 ms tick would
+    # otherwise skip a step every ~25 frames and freeze the scrolling view.
+    accumulator = 0.0
+    # Set by a jump key press and consumed by the next physics step
+    jump_pressed = False
+    # Screen areas touched by moving sprites and HUD on the previous frame,
+    # and the camera/level they were drawn with; see the end of the loop
+    prev_dirty: list[pygame.Rect] = []
+    drawn_view = None
+    clock.tick()
+    while not game_over and not game_completed:
+        accumulator += min(clock.tick(60) / 1000.0, MAX_FRAME_TIME)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return
-        # handle escape to quit
+            if event.type == pygame.KEYDOWN and event.key in JUMP_KEYS:
+                jump_pressed = True
+        # key state is read once per frame and shared with the player
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_ESCAPE] and (game_over or game_completed):
-            return
-        if not game_over and not game_completed:
+        # stop stepping as soon as the game ends; nothing moves after that
+        while accumulator >= STEP - TICK_SLACK and not game_over and not game_completed:
+            accumulator = max(accumulator - STEP, 0.0)
             # movement
-            dx = player.handle_input()
-            player.update(platforms, dx)
-            # coin and enemy updates
-            for coin in coins:
-                coin.update()
+            dx = player.handle_input(keys, jump_pressed)
+            jump_pressed = False
+            # only platforms the player can reach after this frame's move
+            reach = abs(dx)
+            player.update(plat_sweep.query(player.rect.left - reach, player.rect.right + reach), dx)
+            # coin animation and enemy updates
+            coin_tick += 1
+            coin_frame = coin_frames[(coin_tick // 10) % len(coin_frames)]
             for enemy in enemies:
                 enemy.update()
-            # coin collection
-            for coin in coins[:]:
-                if player.rect.colliderect(coin.rect):
-                    score += 1
-                    coin.collect()
-                    coins.remove(coin)
-            # enemy collision
-            for enemy in enemies:
-                if player.rect.colliderect(enemy.rect):
-                    enemy.play_sound()
-                    lives -= 1
-                    # reset player
-                    player.reset_position(spawn_x, spawn_y)
-                    offset_x = 0
-                    break
+            # coin collection; the player's edges are read once and the few
+            # candidate coins are overlap-tested inline
+            p_left, p_top, p_right, p_bottom = (player.rect.left, player.rect.top,
+                                                player.rect.right, player.rect.bottom)
+            collected = [coin for coin in coin_sweep.query(p_left, p_right)
+                         if coin.rect.left < p_right and coin.rect.right > p_left
+                         and coin.rect.top < p_bottom and coin.rect.bottom > p_top]
+            for coin in collected:
+                score += 1
+                coin.collect()
+                coin_sweep.remove(coin, coin.rect.left)
+            # enemy collision; collidelist runs every AABB test in one call
+            # and reports the first enemy hit
+            hit = player.rect.collidelist([enemy.rect for enemy in enemies])
+            if hit != -1:
+                enemies[hit].play_sound()
+                lives -= 1
+                # reset player
+                player.reset_position(spawn_x, spawn_y)
+                offset_x = 0
             if lives <= 0:
                 game_over = True
             # advance level if coins done
-            if not coins:
+            if not coin_sweep.items:
                 current_level += 1
                 if current_level >= len(levels):
                     game_completed = True
                 else:
-                    platforms, coins, enemies, level_length = load_level(current_level)
+                    (platforms, enemies, level_length, plat_sweep, coin_sweep,
+                     platform_layer, platform_layer_y) = load_level(current_level)
                     spawn_x = platforms[0].x + 10
                     spawn_y = platforms[0].y - player_frames[0].get_height()
                     player.reset_position(spawn_x, spawn_y)
                     offset_x = 0
+                    coin_tick = 0
+                    coin_frame = coin_frames[0]
             # reset if fall
             if player.rect.y > screen_height + 300:
                 lives -= 1
@@ -368,41 +457,62 @@ def main() -> None:
             if offset_x > max_offset:
                 offset_x = max_offset
         # draw background
-        bg_w = background.get_width()
-        for i in range(int(level_length / bg_w) + 2):
-            screen.blit(background, (i * bg_w - offset_x * 0.5, 0))
+        screen.blit(bg_strip, (-(int(offset_x * 0.5) % bg_w), 0))
         # draw platforms
-        for plat in platforms:
-            screen.blit(platform_img, (plat.x - offset_x, plat.y))
-        # draw coins
-        for coin in coins:
-            coin.draw(screen, offset_x)
-        # draw enemies
+        screen.blit(platform_layer, (-offset_x, platform_layer_y))
+        # draw coins and enemies inside the viewport only; the coin sweep
+        # holds the uncollected coins sorted by x, so the visible ones are
+        # a binary-searched slice. The drawn areas are kept as dirty rects.
+        view_right = offset_x + screen_width
+        dirty = [coin.draw(screen, offset_x, coin_frame)
+                 for coin in coin_sweep.query(offset_x, view_right)]
         for enemy in enemies:
-            enemy.draw(screen, offset_x)
+            if enemy.rect.right > offset_x and enemy.rect.left < view_right:
+                dirty.append(enemy.draw(screen, offset_x))
         # draw player
-        player.draw(screen, offset_x)
+        dirty.append(player.draw(screen, offset_x))
         # UI
-        score_surf = font.render(f"Score: {score}", True, (0,0,0))
-        level_surf = font.render(f"Level: {current_level+1}/{len(levels)}", True, (0,0,0))
-        screen.blit(score_surf, (15,15))
-        screen.blit(level_surf, (15,45))
+        if score != rendered_score:
+            score_surf = font.render(f"Score: {score}", True, (0,0,0))
+            rendered_score = score
+        if current_level != rendered_level:
+            level_surf = font.render(f"Level: {current_level+1}/{len(levels)}", True, (0,0,0))
+            rendered_level = current_level
+        dirty.append(screen.blit(score_surf, (15,15)))
+        dirty.append(screen.blit(level_surf, (15,45)))
         # draw hearts
         for i in range(lives):
             x = screen_width - (i+1)*(heart_img.get_width()+10) - 15
-            screen.blit(heart_img, (x, 15))
-        if game_over:
-            over = font.render("Game Over", True, (200,0,0))
-            sub = font.render("Press Esc to exit", True, (0,0,0))
-            screen.blit(over, ((screen_width - over.get_width())//2, (screen_height - over.get_height())//2))
-            screen.blit(sub, ((screen_width - sub.get_width())//2, (screen_height - sub.get_height())//2 + 40))
-        if game_completed:
-            win = font.render("You Win!", True, (0,150,0))
-            sub = font.render("Press Esc to exit", True, (0,0,0))
-            screen.blit(win, ((screen_width - win.get_width())//2, (screen_height - win.get_height())//2))
-            screen.blit(sub, ((screen_width - sub.get_width())//2, (screen_height - sub.get_height())//2 + 40))
-        pygame.display.flip()
-        clock.tick(60)
+            dirty.append(screen.blit(heart_img, (x, 15)))
+        if game_over or game_completed:
+            # the end screen overlays its message on this final frame
+            break
+        # While the camera holds still the scenery is unchanged, so only the
+        # areas sprites and HUD covered this frame or the last one are pushed
+        # to the display. Scrolling or a level change redraws the whole view
+        # and needs a full flip.
+        view = (offset_x, current_level)
+        if view == drawn_view:
+            pygame.display.update(prev_dirty + dirty)
+        else:
+            pygame.display.flip()
+        prev_dirty = dirty
+        drawn_view = view
+
+    # End screen: the last frame stays frozen under the result message, so
+    # nothing is redrawn while waiting for Esc or the window to close
+    msg = over_surf if game_over else win_surf
+    screen.blit(msg, ((screen_width - msg.get_width())//2, (screen_height - msg.get_height())//2))
+    screen.blit(exit_surf, ((screen_width - exit_surf.get_width())//2,
+                            (screen_height - exit_surf.get_height())//2 + 40))
+    pygame.display.flip()
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return
+        if pygame.key.get_pressed()[pygame.K_ESCAPE]:
+            return
+        clock.tick(30)
 
 
 if __name__ == '__main__':